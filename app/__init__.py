@@ -4,6 +4,10 @@ from flask import Flask
 
 def create_app():
     app = Flask(__name__)
+    # API responses are consumed by our own scripts; skip key sorting and
+    # pretty-printing when serializing them
+    app.json.sort_keys = False
+    app.json.compact = True
 
     # PostgreSQL-only configuration (JSON backend retired on this branch)
     db_url = os.environ.get("DATABASE_URL")
@@ -28,7 +32,9 @@ def create_app():
         app.logger.exception("PostgreSQL pool initialization failed; continuing without pool")
 
     # Routes use datastore proxies that now target PostgreSQL
-    from . import routes  # type: ignore
+    from . import datastore, routes  # type: ignore
+    # A new app must not serve reads cached by a previous one
+    datastore.invalidate()
     app.register_blueprint(routes.bp)
 
     # Optionally skip full recalculation on startup for faster boot
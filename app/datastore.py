@@ -1,4 +1,9 @@
-from typing import Any, Dict, List, Tuple, Optional
+import os
+import time
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Tuple, Optional
+
+from flask import g, has_app_context
 
 # PostgreSQL-only datastore proxy
 # This module now delegates all operations to datastore_pg so the application
@@ -41,18 +46,116 @@ def _scan_race_in_data(race_id: str, data: Optional[Dict[str, Any]] = None) -> T
     return None, None, None
 
 
-def load_data() -> Dict[str, Any]:
-    return _pg.load_data()
+_READONLY_KEY = "_ds_readonly_tree"
+# Bumped on every write made through this module; keys in-process caches
+_GENERATION = 0
+# Read-only tree shared across requests: (generation, expires_at, tree).
+# The TTL bounds staleness from writes made by other processes.
+_SHARED_TREE: Optional[Tuple[int, float, Dict[str, Any]]] = None
+_DATA_TTL = float(os.environ.get("CACHE_TTL_DATA", "5"))  # seconds
+# race_id -> (season, series, race) over the shared tree: (tree, index)
+_RACE_INDEX: Optional[Tuple[Dict[str, Any], Dict[str, Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]]]] = None
+# Chronologically sorted races of the shared tree: (tree, races)
+_SORTED_RACES: Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]] = None
+# Season years, newest first, cached on the same terms as the shared tree
+_SEASON_YEARS: Optional[Tuple[int, float, Tuple[int, ...]]] = None
+
+
+def generation() -> int:
+    """Return a counter that changes whenever this process writes data."""
+    return _GENERATION
+
+
+def _note_write() -> None:
+    """Note a write: bump the generation and drop cached reads.
+
+    Called once the write has landed (or failed), never before it: a read
+    racing the write could otherwise cache pre-write data under the new
+    generation.
+    """
+    global _GENERATION, _SHARED_TREE, _RACE_INDEX, _SORTED_RACES, _SEASON_YEARS
+    _GENERATION += 1
+    _SHARED_TREE = None
+    _RACE_INDEX = None
+    _SORTED_RACES = None
+    _SEASON_YEARS = None
+    if has_app_context():
+        g.pop(_READONLY_KEY, None)
+
+
+def invalidate() -> None:
+    """Drop every cached read so the next one goes to the database."""
+    _note_write()
+
+
+def _shared_tree() -> Dict[str, Any]:
+    """Return the process-wide read-only tree, reloading when stale."""
+    global _SHARED_TREE
+    now = time.monotonic()
+    cached = _SHARED_TREE
+    if cached is not None and cached[0] == _GENERATION and cached[1] > now:
+        return cached[2]
+    gen = _GENERATION
+    tree = _pg.load_data()
+    if _DATA_TTL > 0:
+        _SHARED_TREE = (gen, now + _DATA_TTL, tree)
+    return tree
+
+
+def load_data(readonly: bool = False) -> Dict[str, Any]:
+    """Return the full data tree.
+
+    With ``readonly=True`` the tree is shared: it is reused across requests
+    until this process writes or ``CACHE_TTL_DATA`` seconds pass, and pinned
+    for the rest of the current request. Such callers must not mutate it.
+    Callers that edit and then ``save_data`` must use the default, which
+    always returns a fresh tree.
+    """
+    if not readonly:
+        return _pg.load_data()
+    if not has_app_context():
+        return _shared_tree()
+    tree = g.get(_READONLY_KEY)
+    if tree is None:
+        tree = _shared_tree()
+        setattr(g, _READONLY_KEY, tree)
+    return tree
 
 
 def save_data(data: Dict[str, Any]) -> None:
-    _pg.save_data(data)
+    try:
+        _pg.save_data(data)
+    finally:
+        _note_write()
 
 
 def list_seasons(data: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     return _pg.list_seasons(data=data)
 
 
+def list_season_years() -> Tuple[int, ...]:
+    """Return the season years, newest first.
+
+    Backed by ``list_seasons`` and reused until this process writes or
+    ``CACHE_TTL_DATA`` seconds pass.
+    """
+    global _SEASON_YEARS
+    now = time.monotonic()
+    cached = _SEASON_YEARS
+    if cached is not None and cached[0] == _GENERATION and cached[1] > now:
+        return cached[2]
+    gen = _GENERATION
+    years = tuple(
+        sorted(
+            {int(s.get("year")) for s in (list_seasons() or []) if s.get("year") is not None},
+            reverse=True,
+        )
+    )
+    if _DATA_TTL > 0:
+        _SEASON_YEARS = (gen, now + _DATA_TTL, years)
+    return years
+
+
 def list_series(data: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     return _pg.list_series(data=data)
 
@@ -75,6 +178,47 @@ def find_race(race_id: str, data: Optional[Dict[str, Any]] = None) -> Tuple[Opti
     return _pg.find_race(race_id, data=data)
 
 
+def find_race_indexed(race_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Return (season, series, race) for ``race_id`` from the shared tree.
+
+    The id index is built once per shared read-only tree, so repeat lookups
+    are O(1) with no database round trip. The returned objects belong to
+    that tree and must not be mutated.
+    """
+    global _RACE_INDEX
+    tree = load_data(readonly=True)
+    cached = _RACE_INDEX
+    if cached is None or cached[0] is not tree:
+        index: Dict[str, Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]] = {}
+        for season in (tree or {}).get("seasons", []) or []:
+            for series in season.get("series", []) or []:
+                for race in series.get("races", []) or []:
+                    rid = race.get("race_id")
+                    if rid:
+                        index[rid] = (season, series, race)
+        cached = (tree, index)
+        _RACE_INDEX = cached
+    return cached[1].get(race_id, (None, None, None))
+
+
+def find_race_series_id(race_id: str) -> Optional[str]:
+    """Return the series_id owning ``race_id`` without loading the race.
+
+    Uses the single-column PostgreSQL lookup; falls back to ``find_race``
+    when the helper is unavailable (e.g., patched datastore in tests).
+    """
+    try:
+        fn = getattr(_pg, "find_race_series_id", None)
+        if callable(fn):
+            return fn(race_id)  # type: ignore[misc]
+    except Exception:
+        pass
+    _season, series, race = _pg.find_race(race_id)
+    if not race:
+        return None
+    return (series or {}).get("series_id") or race.get("series_id")
+
+
 def ensure_season(year: int, data: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     return _pg.ensure_season(year, data=data)
 
@@ -87,6 +231,32 @@ def list_all_races(data: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]
     return _pg.list_all_races(data=data)
 
 
+def find_races(race_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Return race_id -> race (with ``competitors``) for ``race_ids``.
+
+    Uses the bulk PostgreSQL fetch (two queries for any number of ids). With
+    no PostgreSQL backend (e.g., patched datastore in tests), scans one freshly
+    loaded tree instead of looking each race up separately; other database
+    errors propagate. Unknown ids are omitted.
+    """
+    ids = [str(rid) for rid in race_ids if rid]
+    if not ids:
+        return {}
+    try:
+        return _pg.get_races_with_entries(ids)
+    except _pg.BackendUnavailable:
+        pass
+    wanted = set(ids)
+    found: Dict[str, Dict[str, Any]] = {}
+    for season in load_data().get("seasons", []) or []:
+        for series in season.get("series", []) or []:
+            for race in series.get("races", []) or []:
+                rid = race.get("race_id")
+                if rid is not None and str(rid) in wanted:
+                    found[str(rid)] = race
+    return found
+
+
 def get_races() -> List[str]:
     """Return race_ids in chronological order.
 
@@ -112,6 +282,58 @@ def get_races() -> List[str]:
     races_sorted = sorted(races, key=_key)
     return [str(r.get("race_id")) for r in races_sorted if r.get("race_id")]
 
+def get_sorted_races(data: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Return every race dict in ``data`` in global chronological order.
+
+    Flattens the nested seasons/series once and sorts by the ``get_races``
+    order; races it does not list go last, in tree order. If that order is
+    unavailable, races are sorted by (date, start_time) instead.
+    Without ``data`` the shared read-only tree is used and the sorted list is
+    kept for as long as that tree is, so it must not be mutated; pass a tree
+    to get races you may mutate.
+    """
+    global _SORTED_RACES
+    tree = load_data(readonly=True) if data is None else data
+    cached = _SORTED_RACES
+    if data is None and cached is not None and cached[0] is tree:
+        return cached[1]
+    races = chain.from_iterable(
+        series.get("races", []) or []
+        for season in (tree or {}).get("seasons", []) or []
+        for series in season.get("series", []) or []
+    )
+    try:
+        order = {rid: idx for idx, rid in enumerate(get_races() or []) if rid}
+    except Exception:
+        order = {}
+    if order:
+        sorted_races = sorted(races, key=lambda r: order.get(r.get("race_id"), 10**9))
+    else:
+        sorted_races = sorted(races, key=lambda r: (r.get("date") or "", r.get("start_time") or ""))
+    if data is None:
+        _SORTED_RACES = (tree, sorted_races)
+    return sorted_races
+
+def iter_races_chronological() -> Iterator[Dict[str, Any]]:
+    """Yield every race with its ``competitors``, earliest first.
+
+    Streams from PostgreSQL one race at a time. With no PostgreSQL backend
+    (e.g., patched datastore in tests), walks ``get_sorted_races`` instead;
+    those races belong to the shared read-only tree and must not be mutated.
+    Other database errors propagate.
+    """
+    try:
+        stream = _pg.iter_races_chronological()
+        first = next(stream, None)
+    except _pg.BackendUnavailable:
+        yield from get_sorted_races()
+        return
+    if first is None:
+        return
+    yield first
+    yield from stream
+
+
 def list_season_race_ids(season_year: int) -> List[str]:
     """Return race IDs for a given season in chronological order.
 
@@ -152,7 +374,10 @@ def get_fleet(data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
 
 
 def set_fleet(fleet: Dict[str, Any], data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    return _pg.set_fleet(fleet, data=data)
+    try:
+        return _pg.set_fleet(fleet, data=data)
+    finally:
+        _note_write()
 
 
 def get_settings(data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -160,13 +385,37 @@ def get_settings(data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
 
 
 def set_settings(settings: Dict[str, Any], data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    return _pg.set_settings(settings, data=data)
+    try:
+        return _pg.set_settings(settings, data=data)
+    finally:
+        _note_write()
 
 
 # Targeted PostgreSQL helpers (no-op in JSON path; tests should monkeypatch)
 def update_race_row(race_id: str, fields: Dict[str, Any]) -> None:
-    return _pg.update_race_row(race_id, fields)
+    try:
+        return _pg.update_race_row(race_id, fields)
+    finally:
+        _note_write()
 
 
 def replace_race_results(race_id: str, entrants: List[Dict[str, Any]]) -> None:
-    return _pg.replace_race_results(race_id, entrants)
+    try:
+        return _pg.replace_race_results(race_id, entrants)
+    finally:
+        _note_write()
+
+
+def apply_recalculated_handicaps(
+    seed_rows: List[Tuple[str, int, int]],
+    fleet_current: Optional[Dict[str, int]] = None,
+) -> Dict[str, int]:
+    """Batch-write recalculated seeds and fleet handicaps around ``save_data``.
+
+    The write is noted after it lands (even a partial one), so nothing cached
+    in between keeps the old values under the new generation.
+    """
+    try:
+        return _pg.apply_recalculated_handicaps(seed_rows, fleet_current)
+    finally:
+        _note_write()
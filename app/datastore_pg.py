@@ -1,8 +1,12 @@
 import os
 import json
 import re
+import time
 import uuid
-from typing import Any, Dict, List, Optional, Tuple
+import weakref
+from itertools import chain, groupby
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import psycopg2
 from psycopg2 import pool as pg_pool
@@ -12,13 +16,42 @@ from contextlib import contextmanager
 
 
 _POOL: Optional[pg_pool.AbstractConnectionPool] = None
+# Pooled connections that passed the ping recently (conn -> monotonic time)
+# skip it; weak keys drop entries once the pool discards a connection
+_CONN_VERIFIED_AT: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
 _COMPETITOR_CODE_MAXLEN = 20
 _COMPETITOR_CODE_PREFIX = "C_"
 
+# JSONB payloads are machine-read; emit them without whitespace, and pass
+# non-ASCII text through as UTF-8 rather than \u escapes
+_JSON_SEPARATORS = (",", ":")
 
-def _generate_competitor_code(sail_no: Optional[str], existing_codes: set[str]) -> str:
-    """Derive a unique VARCHAR identifier for competitors.competitor_id."""
+
+class BackendUnavailable(RuntimeError):
+    """No PostgreSQL backend to talk to.
+
+    Raised when DATABASE_URL is unset, or when there is no pool and a direct
+    connection cannot be opened. Failures on a working backend (dropped
+    connections, SQL errors) keep their psycopg2 types.
+    """
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=_JSON_SEPARATORS, ensure_ascii=False)
+
+
+def _generate_competitor_code(
+    sail_no: Optional[str],
+    existing_codes: set[str],
+    next_suffix: Optional[Dict[str, int]] = None,
+) -> str:
+    """Derive a unique VARCHAR identifier for competitors.competitor_id.
+
+    ``next_suffix`` (base code -> next suffix to try) lets a caller generating
+    many codes resume probing where the previous collision left off instead
+    of rescanning from ``_1`` each time.
+    """
 
     cleaned = ""
     if sail_no:
@@ -34,13 +67,15 @@ def _generate_competitor_code(sail_no: Optional[str], existing_codes: set[str])
         if base not in existing_codes:
             existing_codes.add(base)
             return base
-        suffix = 1
+        suffix = next_suffix.get(base, 1) if next_suffix is not None else 1
         while suffix < 10000:
             suffix_token = f"_{suffix}"
             max_base_len = _COMPETITOR_CODE_MAXLEN - len(suffix_token)
             candidate = f"{base[:max_base_len]}{suffix_token}"
             if candidate and candidate not in existing_codes:
                 existing_codes.add(candidate)
+                if next_suffix is not None:
+                    next_suffix[base] = suffix + 1
                 return candidate
             suffix += 1
 
@@ -94,6 +129,11 @@ def _connect_kwargs() -> Dict[str, Any]:
     return kwargs
 
 
+def _ping_interval() -> int:
+    """Seconds a pooled connection stays trusted after a successful ping."""
+    return _env_int("DB_PING_INTERVAL", 5) or 0
+
+
 def init_pool(minconn: int = 1, maxconn: int = 10) -> None:
     """Initialize a global connection pool using DATABASE_URL.
 
@@ -118,30 +158,36 @@ def _get_conn():
     """
     url = os.environ.get("DATABASE_URL")
     if not url:
-        raise RuntimeError("DATABASE_URL not set; configure a PostgreSQL connection string")
+        raise BackendUnavailable("DATABASE_URL not set; configure a PostgreSQL connection string")
     if _POOL is not None:
         retried = False
         while True:
             conn = _POOL.getconn()
-            # Lightweight liveness check: SELECT 1
-            healthy = True
-            try:
-                with conn.cursor() as cur:
-                    cur.execute("SELECT 1")
-                # Clear implicit transaction started by SELECT when autocommit is off
+            # Lightweight liveness check: SELECT 1, unless this connection
+            # passed it within the last DB_PING_INTERVAL seconds
+            healthy = getattr(conn, "closed", 0) == 0
+            verified_at = _CONN_VERIFIED_AT.get(conn) if healthy else None
+            if healthy and (verified_at is None or time.monotonic() - verified_at > _ping_interval()):
                 try:
-                    if not getattr(conn, "autocommit", False):
-                        conn.rollback()
+                    with conn.cursor() as cur:
+                        cur.execute("SELECT 1")
+                    # Clear implicit transaction started by SELECT when autocommit is off
+                    try:
+                        if not getattr(conn, "autocommit", False):
+                            conn.rollback()
+                    except Exception:
+                        pass
+                except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                    healthy = False
                 except Exception:
-                    pass
-            except (psycopg2.OperationalError, psycopg2.InterfaceError):
-                healthy = False
-            except Exception:
-                # Treat unexpected ping errors as unhealthy to be safe
-                healthy = False
+                    # Treat unexpected ping errors as unhealthy to be safe
+                    healthy = False
+                if healthy and getattr(conn, "closed", 0) == 0:
+                    _CONN_VERIFIED_AT[conn] = time.monotonic()
 
             if not healthy:
                 # Discard the broken connection and retry once
+                _CONN_VERIFIED_AT.pop(conn, None)
                 try:
                     _POOL.putconn(conn, close=True)
                 except Exception:
@@ -157,6 +203,7 @@ def _get_conn():
                 try:
                     yield conn
                 except Exception:
+                    _CONN_VERIFIED_AT.pop(conn, None)
                     try:
                         conn.rollback()
                     except Exception:
@@ -176,7 +223,10 @@ def _get_conn():
                     _POOL.putconn(conn)
             break
     else:
-        conn = psycopg2.connect(url, **_connect_kwargs())
+        try:
+            conn = psycopg2.connect(url, **_connect_kwargs())
+        except psycopg2.OperationalError as e:
+            raise BackendUnavailable(str(e)) from e
         try:
             try:
                 yield conn
@@ -398,10 +448,10 @@ def save_data(data: Dict[str, Any]) -> None:
                         (
                             settings.get("version"),
                             settings.get("updated_at"),
-                            json.dumps(settings.get("handicap_delta_by_rank", [])),
-                            json.dumps(settings.get("league_points_by_rank", [])),
-                            json.dumps(settings.get("fleet_size_factor", [])),
-                            json.dumps(settings),
+                            _dumps(settings.get("handicap_delta_by_rank", [])),
+                            _dumps(settings.get("league_points_by_rank", [])),
+                            _dumps(settings.get("fleet_size_factor", [])),
+                            _dumps(settings),
                         ),
                     )
                 except Exception as e:
@@ -415,7 +465,7 @@ def save_data(data: Dict[str, Any]) -> None:
                         with conn.cursor() as cur2:
                             cur2.execute(
                                 "INSERT INTO settings (config) VALUES (%s)",
-                                (json.dumps(settings),),
+                                (_dumps(settings),),
                             )
                     else:
                         raise
@@ -514,33 +564,7 @@ def save_data(data: Dict[str, Any]) -> None:
                             )
                             # Replace entrants for this race only when explicitly provided
                             if "competitors" in race:
-                                cur.execute("DELETE FROM race_results WHERE race_id = %s", (rid,))
-                                for ent in (race.get("competitors") or []):
-                                    # Normalize finish_time: empty/whitespace -> NULL for TIME columns
-                                    _ft = ent.get("finish_time")
-                                    finish_val = None
-                                    if _ft is not None:
-                                        s = str(_ft).strip()
-                                        finish_val = None if s == "" else s
-                                    cid = ent.get("competitor_id")
-                                    cid_int = int(cid) if cid is not None else None
-                                    cur.execute(
-                                        """
-                                        INSERT INTO race_results (race_id, competitor_ref, initial_handicap, finish_time, handicap_override)
-                                        VALUES (%s, %s, %s, %s, %s)
-                                        ON CONFLICT (race_id, competitor_ref) DO UPDATE SET
-                                            initial_handicap = EXCLUDED.initial_handicap,
-                                            finish_time = EXCLUDED.finish_time,
-                                            handicap_override = EXCLUDED.handicap_override
-                                        """,
-                                        (
-                                            rid,
-                                            cid_int,
-                                            ent.get("initial_handicap"),
-                                            finish_val,
-                                            ent.get("handicap_override"),
-                                        ),
-                                    )
+                                _write_race_entrants(cur, rid, race.get("competitors") or [])
 
                 # Delete races no longer present (handles race deletions/renames)
                 try:
@@ -668,6 +692,18 @@ def find_race(race_id: str, data: Optional[Dict[str, Any]] = None) -> Tuple[Opti
         return season, series, race
 
 
+def find_race_series_id(race_id: str) -> Optional[str]:
+    """Return the canonical series_id for ``race_id`` or None if not found.
+
+    Single-column lookup for callers that only need the owning series (e.g.
+    redirects) and would otherwise fetch the race entrants and series races.
+    """
+    with _get_conn() as conn, conn.cursor() as cur:
+        cur.execute("SELECT series_id FROM races WHERE race_id = %s", (race_id,))
+        row = cur.fetchone()
+        return row[0] if row else None
+
+
 def list_all_races(data: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     out: List[Dict[str, Any]] = []
     with _get_conn() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
@@ -967,6 +1003,7 @@ def set_fleet(fleet: Dict[str, Any], data: Optional[Dict[str, Any]] = None) -> D
         existing_ids: set[int] = set()
         existing_codes: set[str] = set()
         existing_codes_by_id: Dict[int, str] = {}
+        code_suffixes: Dict[str, int] = {}
         try:
             cur.execute("SELECT id, competitor_id FROM competitors")
             existing_rows = cur.fetchall() or []
@@ -1010,7 +1047,7 @@ def set_fleet(fleet: Dict[str, Any], data: Optional[Dict[str, Any]] = None) -> D
                 raise ValueError(f"Invalid current handicap for competitor {sailor or boat or sail_no}: {curr_raw}") from exc
 
             if cid is None:
-                generated_code = _generate_competitor_code(sail_no, existing_codes)
+                generated_code = _generate_competitor_code(sail_no, existing_codes, code_suffixes)
                 cur.execute(
                     """
                     INSERT INTO competitors (
@@ -1045,7 +1082,7 @@ def set_fleet(fleet: Dict[str, Any], data: Optional[Dict[str, Any]] = None) -> D
                     continue
                 competitor_code = existing_codes_by_id.get(int(cid))
                 if not competitor_code:
-                    competitor_code = _generate_competitor_code(sail_no, existing_codes)
+                    competitor_code = _generate_competitor_code(sail_no, existing_codes, code_suffixes)
                     try:
                         existing_codes_by_id[int(cid)] = competitor_code
                     except Exception:
@@ -1161,15 +1198,15 @@ def set_settings(settings: Dict[str, Any], data: Optional[Dict[str, Any]] = None
                 (
                     settings.get("version"),
                     settings.get("updated_at"),
-                    json.dumps(settings.get("handicap_delta_by_rank", [])),
-                    json.dumps(settings.get("league_points_by_rank", [])),
-                    json.dumps(settings.get("fleet_size_factor", [])),
-                    json.dumps(settings),
+                    _dumps(settings.get("handicap_delta_by_rank", [])),
+                    _dumps(settings.get("league_points_by_rank", [])),
+                    _dumps(settings.get("fleet_size_factor", [])),
+                    _dumps(settings),
                 ),
             )
         except Exception as e:
             if isinstance(e, getattr(pg_errors, "UndefinedColumn", tuple())) or isinstance(e, getattr(pg_errors, "UndefinedTable", tuple())):
-                cur.execute("INSERT INTO settings (config) VALUES (%s)", (json.dumps(settings),))
+                cur.execute("INSERT INTO settings (config) VALUES (%s)", (_dumps(settings),))
             else:
                 raise
         conn.commit()
@@ -1182,34 +1219,27 @@ def normalize_competitor_ids() -> Dict[str, Any]:
 
 
 def apply_recalculated_handicaps(
-    pre_by_race: Dict[str, Dict[str, int]],
+    seed_rows: List[Tuple[str, int, int]],
     fleet_current: Optional[Dict[str, int]] = None,
 ) -> Dict[str, int]:
     """Apply computed pre-race handicaps and fleet currents directly in PostgreSQL.
 
-    - Updates race_results.initial_handicap for each (race_id, competitor_id) where
-      there is no manual override (handicap_override IS NULL) and the stored value
-      differs from the computed seed. Uses IS DISTINCT FROM to handle NULL safely.
-    - Optionally updates competitors.current_handicap_s_per_hr from the provided map.
+    - Updates race_results.initial_handicap for each ``(race_id, competitor_id,
+      seed)`` row where the stored value differs from the computed seed. For a
+      row with a manual override the seed is the override itself, so it is
+      written like any other. Uses IS DISTINCT FROM to handle NULL safely. The
+      rows feed ``execute_values`` as they are.
+    - Optionally updates competitors.current_handicap_s_per_hr from the
+      provided map, even when there are no seed rows.
 
     Returns a stats dict with counts of updated rows.
     """
     stats = {"race_rows_updated": 0, "competitors_updated": 0}
-    if not pre_by_race:
+    if not seed_rows and not fleet_current:
         return stats
+    rows = seed_rows
     with _get_conn() as conn, conn.cursor() as cur:
         # Update race_results seeds in bulk using a VALUES table
-        # Build (race_id, competitor_ref, seed) tuples
-        rows: List[Tuple[str, int, int]] = []
-        for rid, cmap in pre_by_race.items():
-            if not rid or not isinstance(cmap, dict):
-                continue
-            for cid, seed in cmap.items():
-                try:
-                    rows.append((str(rid), int(cid), int(seed)))
-                except Exception:
-                    continue
-
         if rows:
             # Chunk large updates to keep statements reasonable in size
             chunk_size = 2000
@@ -1222,13 +1252,12 @@ def apply_recalculated_handicaps(
                     FROM (VALUES %s) AS v(race_id, competitor_ref, seed)
                     WHERE rr.race_id = v.race_id
                       AND rr.competitor_ref = v.competitor_ref
-                      AND (rr.handicap_override IS NULL)
                       AND (rr.initial_handicap IS DISTINCT FROM v.seed)
                     """
                 )
-                # execute_values will expand the VALUES %s placeholder
-                execute_values(cur, sql, chunk)
-                # psycopg2 rowcount reflects rows affected by the UPDATE
+                # execute_values expands VALUES %s; one page per chunk keeps it a
+                # single statement, so rowcount covers the whole chunk
+                execute_values(cur, sql, chunk, page_size=len(chunk))
                 stats["race_rows_updated"] += cur.rowcount or 0
 
         # Update fleet currents if provided
@@ -1252,7 +1281,7 @@ def apply_recalculated_handicaps(
                           AND (c.current_handicap_s_per_hr IS DISTINCT FROM v.cur_h)
                         """
                     )
-                    execute_values(cur, sql2, chunk2)
+                    execute_values(cur, sql2, chunk2, page_size=len(chunk2))
                     stats["competitors_updated"] += cur.rowcount or 0
         conn.commit()
     return stats
@@ -1315,6 +1344,50 @@ def get_races_with_entries(race_ids: List[str]) -> Dict[str, Dict[str, Any]]:
     return meta
 
 
+def iter_races_chronological() -> Iterator[Dict[str, Any]]:
+    """Yield {race_id, date, start_time, competitors[]} for every race, earliest first.
+
+    Streams one ordered join through a server-side cursor so only the rows of
+    the race being assembled are held in memory. Ordering matches
+    ``get_races``.
+    """
+    with _get_conn() as conn, conn.cursor(name="iter_races", cursor_factory=RealDictCursor) as cur:
+        cur.itersize = 2000
+        cur.execute(
+            """
+            SELECT r.race_id, r.date, r.start_time,
+                   rr.competitor_ref AS competitor_id, rr.initial_handicap,
+                   rr.finish_time, rr.handicap_override
+            FROM races r
+            LEFT JOIN race_results rr ON rr.race_id = r.race_id
+            ORDER BY r.date ASC NULLS LAST,
+                     r.start_time ASC NULLS LAST,
+                     r.race_id ASC,
+                     rr.competitor_ref ASC
+            """
+        )
+        for rid, rows in groupby(cur, key=itemgetter("race_id")):
+            first = next(rows)
+            competitors: List[Dict[str, Any]] = []
+            for ent in chain((first,), rows):
+                if ent.get("competitor_id") is None:
+                    continue  # race without results (LEFT JOIN filler)
+                competitors.append(
+                    {
+                        "competitor_id": ent.get("competitor_id"),
+                        "initial_handicap": ent.get("initial_handicap"),
+                        "finish_time": _time_to_str(ent.get("finish_time")),
+                        "handicap_override": ent.get("handicap_override"),
+                    }
+                )
+            yield {
+                "race_id": rid,
+                "date": first.get("date").isoformat() if first.get("date") else None,
+                "start_time": _time_to_str(first.get("start_time")),
+                "competitors": competitors,
+            }
+
+
 def update_race_row(race_id: str, fields: Dict[str, Any]) -> None:
     """Update selected columns of a race row.
 
@@ -1342,34 +1415,58 @@ def update_race_row(race_id: str, fields: Dict[str, Any]) -> None:
         conn.commit()
 
 
+def _write_race_entrants(cur, race_id: str, entrants: List[Dict[str, Any]]) -> None:
+    """Sync race_results rows for one race with ``entrants`` as a delta.
+
+    Rows for competitors no longer listed are deleted and the rest are upserted
+    in place with one batched statement, so a changed finish time no longer
+    drops and re-creates the race.
+    Every listed field is overwritten, so an entrant without
+    ``initial_handicap`` gets NULL exactly as if the row were re-created.
+    """
+    rows: List[Tuple[str, Optional[int], Optional[int], Optional[str], Optional[int]]] = []
+    keep_ids: List[int] = []
+    for ent in entrants:
+        cid = ent.get('competitor_id')
+        cid_int = int(cid) if cid is not None else None
+        if cid_int is not None:
+            keep_ids.append(cid_int)
+        # Normalize finish_time: empty/whitespace -> NULL for TIME columns
+        _ft = ent.get('finish_time')
+        finish_val = None
+        if _ft is not None:
+            s = str(_ft).strip()
+            finish_val = None if s == '' else s
+        rows.append((str(race_id), cid_int, ent.get('initial_handicap'), finish_val, ent.get('handicap_override')))
+    cur.execute(
+        "DELETE FROM race_results WHERE race_id = %s AND NOT (competitor_ref = ANY(%s))",
+        (str(race_id), keep_ids),
+    )
+    if not rows:
+        return
+    # One upsert cannot touch a row twice; the last entry for a competitor wins
+    by_cid = {row[1]: row for row in rows if row[1] is not None}
+    rows = [row for row in rows if row[1] is None] + list(by_cid.values())
+    execute_values(
+        cur,
+        """
+        INSERT INTO race_results (race_id, competitor_ref, initial_handicap, finish_time, handicap_override)
+        VALUES %s
+        ON CONFLICT (race_id, competitor_ref) DO UPDATE SET
+            initial_handicap = EXCLUDED.initial_handicap,
+            finish_time = EXCLUDED.finish_time,
+            handicap_override = EXCLUDED.handicap_override
+        """,
+        rows,
+        page_size=len(rows),
+    )
+
+
 def replace_race_results(race_id: str, entrants: List[Dict[str, Any]]) -> None:
     """Replace entrants (race_results) for a single race ID.
 
     Entrants fields: competitor_id, initial_handicap, finish_time (HH:MM:SS or None), handicap_override
     """
     with _get_conn() as conn, conn.cursor() as cur:
-        cur.execute("DELETE FROM race_results WHERE race_id = %s", (race_id,))
-        rows: List[Tuple[str, Optional[int], Optional[str], Optional[int]]] = []
-        for ent in (entrants or []):
-            cid = ent.get('competitor_id')
-            cid_int = int(cid) if cid is not None else None
-            # Normalize finish_time: empty/whitespace -> NULL
-            _ft = ent.get('finish_time')
-            finish_val = None
-            if _ft is not None:
-                s = str(_ft).strip()
-                finish_val = None if s == '' else s
-            rows.append((str(race_id), cid_int, finish_val, ent.get('handicap_override')))
-        if rows:
-            execute_values(
-                cur,
-                """
-                INSERT INTO race_results (race_id, competitor_ref, finish_time, handicap_override)
-                VALUES %s
-                ON CONFLICT (race_id, competitor_ref) DO UPDATE SET
-                    finish_time = EXCLUDED.finish_time,
-                    handicap_override = EXCLUDED.handicap_override
-                """,
-                rows,
-            )
+        _write_race_entrants(cur, race_id, list(entrants or []))
         conn.commit()
@@ -1,10 +1,17 @@
-from flask import Blueprint, redirect, render_template, url_for, abort, request, current_app
+from flask import Blueprint, redirect, render_template, url_for, abort, request, current_app, g
 import json
-import importlib
 from datetime import datetime, timezone, date
 import os
+import re
 import time
 import hashlib
+import heapq
+import functools
+import itertools
+import operator
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor
 
 from .scoring import calculate_race_results, _scaling_factor
@@ -18,6 +25,7 @@ from .datastore import (
     list_season_races_with_results as ds_list_season_races_with_results,
     find_series as ds_find_series,
     find_race as ds_find_race,
+    find_race_series_id as ds_find_race_series_id,
     ensure_series as ds_ensure_series,
     renumber_races as ds_renumber_races,
     get_fleet as ds_get_fleet,
@@ -27,22 +35,105 @@ from .datastore import (
 )
 from .datastore import update_race_row as ds_update_race_row
 from .datastore import replace_race_results as ds_replace_race_results
+from .datastore import apply_recalculated_handicaps as ds_apply_recalculated_handicaps
 from .datastore import get_races as ds_get_races
+from .datastore import get_sorted_races as ds_get_sorted_races
+from .datastore import generation as ds_generation
+from .datastore import invalidate as ds_invalidate
 from .datastore import list_season_race_ids as ds_list_season_race_ids
+from .datastore import list_season_years as ds_list_season_years
+from .datastore import find_race_indexed as ds_find_race_indexed
+from .datastore import find_races as ds_find_races
+from .datastore import iter_races_chronological as ds_iter_races_chronological
+from . import datastore_pg as _pg
 
 
 bp = Blueprint('main', __name__)
 
-# Simple in-process caches for expensive computations
-_STANDINGS_CACHE: dict[tuple[int, str], tuple[float, tuple[list[dict], list[dict]]]] = {}
-_RACE_CACHE: dict[str, tuple[float, dict, int]] = {}
 _STANDINGS_TTL = int(os.environ.get('CACHE_TTL_STANDINGS', '180'))  # seconds
 _RACE_TTL = int(os.environ.get('CACHE_TTL_RACE', '120'))  # seconds
 
+
+class _TTLCache:
+    """Bounded LRU mapping whose entries expire ``ttl`` seconds after being set.
+
+    Expiry uses ``time.monotonic()`` so wall-clock adjustments cannot revive
+    or prematurely drop entries. The least recently used entry is evicted once
+    ``maxsize`` is exceeded.
+    """
+
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = max(1, int(maxsize))
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def keys(self) -> list:
+        with self._lock:
+            return list(self._data)
+
+
+# Simple in-process caches for expensive computations
+# Standings: (season, scoring) -> (datastore generation, (table, groups))
+_STANDINGS_CACHE = _TTLCache(_STANDINGS_TTL, int(os.environ.get('CACHE_MAX_STANDINGS', '128')))
+# Race results: race_id -> (results, fleet_adjustment)
+_RACE_CACHE = _TTLCache(_RACE_TTL, int(os.environ.get('CACHE_MAX_RACES', '512')))
+# Rendered GET pages: (path, query string) -> (generation, body, status, headers)
+_RESPONSE_CACHE = _TTLCache(int(os.environ.get('CACHE_TTL_PAGES', '60')), 256)
+# Standings race results by content: (race_id, entries key) -> results
+_RACE_RESULTS_CACHE = _TTLCache(_STANDINGS_TTL, int(os.environ.get('CACHE_MAX_RACES', '512')))
+# Handicap map *after* each race: (season_year, race_id) -> (generation, map)
+_SNAPSHOT_CACHE = _TTLCache(_RACE_TTL, int(os.environ.get('CACHE_MAX_RACES', '512')))
+# Fleet lookup and race order: name -> (generation, mapping)
+_META_CACHE = _TTLCache(int(os.environ.get('CACHE_TTL_META', '60')), 4)
+
 # Lightweight background executor for async tasks
 _EXECUTOR = ThreadPoolExecutor(max_workers=int(os.environ.get('WORKER_THREADS', '1')))
 _RECALC_ACTIVE: set[str] = set()
 
+# Debounced full recalculation: edits landing within the window coalesce
+_RECALC_DEBOUNCE_S = int(os.environ.get('RECALC_DEBOUNCE_MS', '500')) / 1000.0
+_RECALC_ALL_KEY = '__all__'
+_RECALC_TIMER: threading.Timer | None = None
+_RECALC_TIMER_LOCK = threading.Lock()
+
+
+def _parse_iso_date(value: str) -> date:
+    """Return the date for a ``YYYY-MM-DD`` string or raise ``ValueError``.
+
+    Reads the fields from fixed offsets, which is far cheaper than
+    ``strptime`` for the only format the UI sends.
+    """
+    if len(value) != 10 or value[4] != '-' or value[7] != '-':
+        raise ValueError(f'Invalid date {value!r}; expected YYYY-MM-DD')
+    return date(int(value[:4]), int(value[5:7]), int(value[8:10]))
+
 
 @bp.app_template_filter('dmy_date')
 def _format_date_dmy(value):
@@ -53,9 +144,10 @@ def _format_date_dmy(value):
         return value.strftime('%d-%m-%Y')
     if isinstance(value, str):
         try:
-            return datetime.strptime(value, '%Y-%m-%d').strftime('%d-%m-%Y')
+            _parse_iso_date(value)
         except ValueError:
             return value
+        return f'{value[8:10]}-{value[5:7]}-{value[:4]}'
     return value
 
 
@@ -156,55 +248,110 @@ def _scoring_content_hash_filtered(settings: dict, finishers: int | None) -> str
     return hashlib.sha1(data.encode('utf-8')).hexdigest()
 
 
+def _standings_key(season: int, scoring: str) -> tuple[int, str]:
+    # Anything other than "traditional" scores as league; keep one entry for both
+    return int(season), ('traditional' if scoring == 'traditional' else 'league')
+
+
 def _cache_get_standings(season: int, scoring: str) -> tuple[list[dict], list[dict]] | None:
-    key = (int(season), scoring)
+    key = _standings_key(season, scoring)
     entry = _STANDINGS_CACHE.get(key)
-    if not entry:
+    if entry is None:
         return None
-    exp, value = entry
-    if exp < time.time():
-        _STANDINGS_CACHE.pop(key, None)
+    gen, value = entry
+    if gen != ds_generation():
+        _STANDINGS_CACHE.pop(key)
         return None
     return value
 
 
-def _cache_set_standings(season: int, scoring: str, table: list[dict], groups: list[dict]) -> None:
-    _STANDINGS_CACHE[(int(season), scoring)] = (time.time() + _STANDINGS_TTL, (table, groups))
+def _cache_set_standings(
+    season: int, scoring: str, table: list[dict], groups: list[dict], generation: int | None = None
+) -> None:
+    """Store standings; pass the ``generation`` read before computing them."""
+    gen = ds_generation() if generation is None else generation
+    _STANDINGS_CACHE.set(_standings_key(season, scoring), (gen, (table, groups)))
 
 
 def _cache_get_race(race_id: str) -> tuple[dict, int] | None:
-    entry = _RACE_CACHE.get(race_id or '')
-    if not entry:
-        return None
-    exp, results, fleet_adj = entry
-    if exp < time.time():
-        _RACE_CACHE.pop(race_id, None)
-        return None
-    return results, fleet_adj
+    return _RACE_CACHE.get(race_id or '')
 
 
 def _cache_set_race(race_id: str, results: dict, fleet_adjustment: int) -> None:
     if not race_id:
         return
-    _RACE_CACHE[race_id] = (time.time() + _RACE_TTL, results, int(fleet_adjustment or 0))
+    _RACE_CACHE.set(race_id, (results, int(fleet_adjustment or 0)))
+
+
+def _invalidate_meta_caches() -> None:
+    _META_CACHE.clear()
 
 
 def _cache_clear_all() -> None:
     _STANDINGS_CACHE.clear()
+    _RESPONSE_CACHE.clear()
     _RACE_CACHE.clear()
+    _RACE_RESULTS_CACHE.clear()
+    _SNAPSHOT_CACHE.clear()
+    _invalidate_meta_caches()
+
+
+def _race_results_by_content(race_id: str, entries: list[dict]) -> list[dict]:
+    """Return ``calculate_race_results(entries)``, reusing identical inputs.
+
+    Keyed on every entry field the calculation reads or copies, so a race
+    whose entrants did not change is not rescored when other races do.
+    Scoring settings changes clear the cache. The results are shared and
+    must not be mutated.
+    """
+    key = (race_id, tuple(
+        (e['competitor_id'], e['start'], e['initial_handicap'], e.get('finish'), e.get('status'),
+         e.get('sailor'), e.get('boat'), e.get('sail_number'))
+        for e in entries
+    ))
+    results = _RACE_RESULTS_CACHE.get(key)
+    if results is None:
+        results = calculate_race_results(entries)
+        _RACE_RESULTS_CACHE.set(key, results)
+    return results
 
 
 def _cache_delete_race(race_id: str) -> None:
-    _RACE_CACHE.pop(race_id or '', None)
+    _RACE_CACHE.pop(race_id or '')
+    # Pages are keyed by URL, not by race; drop them all
+    _RESPONSE_CACHE.clear()
 
 
 def _cache_delete_standings_for_season(season: int | None) -> None:
     if season is None:
         return
     season_int = int(season)
-    for key in list(_STANDINGS_CACHE.keys()):
+    for key in _STANDINGS_CACHE.keys():
         if key and key[0] == season_int:
-            _STANDINGS_CACHE.pop(key, None)
+            _STANDINGS_CACHE.pop(key)
+    _RESPONSE_CACHE.clear()
+
+
+def _cache_response(view):
+    """Serve repeat GETs of ``view`` from ``_RESPONSE_CACHE``.
+
+    Keyed by path and query string and valid until the next write, so a hit
+    skips both the data work and template rendering. Only plain 200
+    responses that set no cookies are stored.
+    """
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        key = (request.path, request.query_string)
+        gen = ds_generation()
+        hit = _RESPONSE_CACHE.get(key)
+        if hit is not None and hit[0] == gen:
+            _gen, body, status, headers = hit
+            return current_app.response_class(body, status=status, headers=headers)
+        rv = current_app.make_response(view(*args, **kwargs))
+        if rv.status_code == 200 and not rv.direct_passthrough and 'Set-Cookie' not in rv.headers:
+            _RESPONSE_CACHE.set(key, (gen, rv.get_data(), rv.status_code, list(rv.headers.items())))
+        return rv
+    return wrapper
 
 
 def _cache_delete_races_from(start_race_id: str) -> None:
@@ -220,7 +367,90 @@ def _cache_delete_races_from(start_race_id: str) -> None:
         _cache_delete_race(start_race_id)
 
 
-def _schedule_forward_recalc(race_id: str) -> None:
+def _request_json() -> dict:
+    """Parse a JSON request body straight from its raw bytes.
+
+    Shared by every JSON endpoint so they fail the same way: a non-JSON
+    Content-Type aborts with 415, and malformed or non-object JSON aborts with
+    400, each with an ``{"error": ...}`` body. An empty body yields ``{}``.
+    Avoids the intermediate ``str`` decode done by ``request.get_json``. The
+    body is consumed, so the parsed object is kept for later callers in the
+    same request.
+    """
+    data = g.get('_request_json')
+    if data is not None:
+        return data
+    if not request.is_json:
+        abort(current_app.make_response(({'error': 'Request body must be JSON (Content-Type: application/json).'}, 415)))
+    raw = request.get_data(cache=False)
+    if not raw:
+        data = {}
+    else:
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            abort(current_app.make_response(({'error': 'Request body must be valid JSON.'}, 400)))
+        if not isinstance(data, dict):
+            abort(current_app.make_response(({'error': 'Request body must be a JSON object.'}, 400)))
+    g._request_json = data
+    return data
+
+
+def _prune_seasons_for_save(seasons: list[dict], keep_ids: set[str]) -> list[dict]:
+    """Copy ``seasons`` for ``save_data`` keeping entrants only for ``keep_ids``.
+
+    Races without a ``competitors`` key have their results left untouched by
+    the datastore, so only the races named here get their entrants rewritten.
+    """
+    out: list[dict] = []
+    for season in (seasons or []):
+        s_copy = dict(season)
+        series_list = []
+        for series in (season.get('series') or []):
+            se_copy = dict(series)
+            races_out = []
+            for race in (series.get('races') or []):
+                r_copy = dict(race)
+                rid = r_copy.get('race_id')
+                if rid not in keep_ids and 'competitors' in r_copy:
+                    r_copy.pop('competitors', None)
+                races_out.append(r_copy)
+            se_copy['races'] = races_out
+            series_list.append(se_copy)
+        s_copy['series'] = series_list
+        out.append(s_copy)
+    return out
+
+
+def _detach_race(series: dict, race: dict) -> None:
+    """Remove ``race`` from ``series['races']`` by identity.
+
+    ``list.remove`` compares with ``==``, deep-comparing every race dict it
+    passes; the race in hand is always the very object stored in the list.
+    """
+    races = series.get('races') or []
+    for idx, candidate in enumerate(races):
+        if candidate is race:
+            del races[idx]
+            return
+    races.remove(race)
+
+
+def _season_year_of(series: dict | None) -> int | None:
+    """Return the season year recorded on an in-hand series object, if any."""
+    try:
+        year = (series or {}).get('season')
+        return int(year) if year is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _schedule_forward_recalc(race_id: str, season_year: int | None = None) -> None:
+    """Run ``recalculate_handicaps_from`` in the background executor.
+
+    Callers that already hold the race's series should pass ``season_year``
+    so neither the job nor the recalculation has to look the race up again.
+    """
     def _job():
         try:
             # mark active
@@ -228,19 +458,22 @@ def _schedule_forward_recalc(race_id: str) -> None:
                 _RECALC_ACTIVE.add(race_id)
             except Exception:
                 pass
-            recalculate_handicaps_from(race_id)
+            recalculate_handicaps_from(race_id, season_year=season_year)
         except Exception:
             # Ignore background failures; the next page view will recompute on demand
             pass
         # After recompute, drop caches for forward races and season standings
+        year = season_year
+        if year is None:
+            try:
+                season_obj, _series_obj, _race_obj = ds_find_race(race_id)
+                year = (season_obj or {}).get('year') if season_obj else None
+            except Exception:
+                year = None
         try:
-            season_obj, _series_obj, _race_obj = ds_find_race(race_id)
-            season_year = (season_obj or {}).get('year') if season_obj else None
-        except Exception:
-            season_year = None
-        try:
+            _invalidate_meta_caches()
             _cache_delete_races_from(race_id)
-            _cache_delete_standings_for_season(season_year)
+            _cache_delete_standings_for_season(year)
         except Exception:
             pass
         finally:
@@ -256,6 +489,54 @@ def _schedule_forward_recalc(race_id: str) -> None:
         _job()
 
 
+def _run_full_recalc() -> None:
+    try:
+        _RECALC_ACTIVE.add(_RECALC_ALL_KEY)
+        recalculate_handicaps()
+    except Exception:
+        # Ignore background failures; the next page view will recompute on demand
+        pass
+    finally:
+        _cache_clear_all()
+        with _RECALC_TIMER_LOCK:
+            # A run queued meanwhile keeps the recalc reported as active
+            if _RECALC_TIMER is None:
+                _RECALC_ACTIVE.discard(_RECALC_ALL_KEY)
+
+
+def _schedule_full_recalc() -> None:
+    """Debounce ``recalculate_handicaps`` onto the background executor.
+
+    Each call restarts the timer, so a burst of edits results in a single
+    recalculation once things go quiet. Under testing (or with a zero
+    debounce) the recalculation runs inline so callers observe its effects.
+    """
+    global _RECALC_TIMER
+    if _RECALC_DEBOUNCE_S <= 0 or current_app.testing:
+        _run_full_recalc()
+        return
+
+    def _submit():
+        global _RECALC_TIMER
+        with _RECALC_TIMER_LOCK:
+            if _RECALC_TIMER is threading.current_thread():
+                _RECALC_TIMER = None
+        try:
+            _EXECUTOR.submit(_run_full_recalc)
+        except Exception:
+            # Fallback to synchronous execution if executor unavailable
+            _run_full_recalc()
+
+    with _RECALC_TIMER_LOCK:
+        if _RECALC_TIMER is not None:
+            _RECALC_TIMER.cancel()
+        # Queued counts as in progress for recalc_status until the run ends
+        _RECALC_ACTIVE.add(_RECALC_ALL_KEY)
+        _RECALC_TIMER = threading.Timer(_RECALC_DEBOUNCE_S, _submit)
+        _RECALC_TIMER.daemon = True
+        _RECALC_TIMER.start()
+
+
 @bp.route('/api/recalc/status')
 def recalc_status():
     """Return whether background forward recalculation is active.
@@ -282,7 +563,6 @@ def health_db():
     returns basic server/user info. Always returns HTTP 200 with a JSON body
     describing connection status.
     """
-    import os
     url = os.environ.get('DATABASE_URL')
     if not url:
         return {
@@ -291,14 +571,7 @@ def health_db():
             'message': 'DATABASE_URL is not set; JSON backend likely in use.'
         }
     try:
-        import psycopg2  # type: ignore
-        from . import datastore_pg as _pg
-        with psycopg2.connect(url, **_pg._connect_kwargs()) as conn:
-            # CREATE INDEX CONCURRENTLY requires autocommit
-            try:
-                conn.autocommit = True
-            except Exception:
-                pass
+        with _pg._get_conn() as conn:
             with conn.cursor() as cur:
                 cur.execute('SELECT current_user, current_database(), version()')
                 user, db, ver = cur.fetchone()
@@ -309,12 +582,6 @@ def health_db():
                 'database': db,
                 'server_version': (ver or '').split('\n')[0],
             }
-    except ImportError:
-        return {
-            'connected': False,
-            'status': 'client_missing',
-            'error': 'psycopg2 is not installed in this environment.'
-        }
     except Exception as e:  # pragma: no cover - best-effort health output
         return {
             'connected': False,
@@ -322,13 +589,43 @@ def health_db():
             'error': str(e),
         }
 
+# Innermost "(...)" groups of an index definition, i.e. its column lists
+_INDEX_COLS_RE = re.compile(r'\(([^()]*)\)')
+
+
+def _build_index_lookup(rows) -> dict[str, set[str]]:
+    """Map table -> normalized column lists from ``pg_indexes`` rows.
+
+    Each ``indexdef`` is lowercased, stripped of spaces and parsed once, so
+    checking for an index is a set lookup.
+    """
+    by_table: dict[str, set[str]] = {}
+    for table, _name, defn in rows:
+        cols = _INDEX_COLS_RE.findall((defn or '').lower().replace(' ', ''))
+        by_table.setdefault(table, set()).update(cols)
+    return by_table
+
+
+def _fetch_index_lookup(cur) -> dict[str, set[str]]:
+    """Run the one ``pg_indexes`` query both index routes need and map it."""
+    cur.execute(
+        """
+        SELECT tablename, indexname, indexdef
+        FROM pg_indexes
+        WHERE schemaname = 'public'
+          AND tablename IN ('seasons','series','races','race_results','competitors','settings')
+        ORDER BY tablename, indexname
+        """
+    )
+    return _build_index_lookup(cur.fetchall())
+
+
 @bp.route('/health/indexes')
 def health_indexes():
     """Report presence of recommended indexes for performance.
 
     Checks for common lookup indexes on foreign keys and date ordering.
     """
-    import os
     url = os.environ.get('DATABASE_URL')
     if not url:
         return {
@@ -337,32 +634,12 @@ def health_indexes():
             'message': 'DATABASE_URL is not set; cannot inspect PostgreSQL indexes.'
         }
     try:
-        import psycopg2  # type: ignore
-        from . import datastore_pg as _pg
-        with psycopg2.connect(url, **_pg._connect_kwargs()) as conn:
+        with _pg._get_conn() as conn:
             with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT tablename, indexname, indexdef
-                    FROM pg_indexes
-                    WHERE schemaname = 'public'
-                      AND tablename IN ('seasons','series','races','race_results','competitors','settings')
-                    ORDER BY tablename, indexname
-                    """
-                )
-                idx = cur.fetchall()
-        # Helper to find an index by exact leading column list
+                idx = _fetch_index_lookup(cur)
+        # Helper to find an index by its exact column list
         def has_index(table: str, cols: str) -> bool:
-            cols_norm = cols.replace(' ', '')
-            for t, _name, defn in idx:
-                if t != table:
-                    continue
-                # Normalize definition
-                d = (defn or '').lower().replace(' ', '')
-                # Match "(col1,col2,...)" anywhere in def
-                if f'({cols_norm})' in d:
-                    return True
-            return False
+            return cols.replace(' ', '').lower() in idx.get(table, ())
 
         checks = {
             'series(season_id)': has_index('series', 'season_id'),
@@ -404,12 +681,6 @@ def health_indexes():
             'missing': missing,
             'suggestions': suggestions,
         }
-    except ImportError:
-        return {
-            'connected': False,
-            'status': 'client_missing',
-            'error': 'psycopg2 is not installed in this environment.'
-        }
     except Exception as e:  # pragma: no cover
         return {
             'connected': False,
@@ -424,7 +695,6 @@ def health_schema():
     - Confirms race_results.handicap_override column exists
     - Reports the data type of race_results.finish_time (expects TIME)
     """
-    import os
     url = os.environ.get('DATABASE_URL')
     if not url:
         return {
@@ -433,27 +703,20 @@ def health_schema():
             'message': 'DATABASE_URL is not set; cannot inspect PostgreSQL schema.'
         }
     try:
-        import psycopg2  # type: ignore
-        from . import datastore_pg as _pg
-        with psycopg2.connect(url, **_pg._connect_kwargs()) as conn:
+        with _pg._get_conn() as conn:
             with conn.cursor() as cur:
+                # Both checks in one catalog query
                 cur.execute(
                     """
-                    SELECT 1 FROM information_schema.columns
-                    WHERE table_schema='public' AND table_name='race_results' AND column_name='handicap_override'
-                    """
-                )
-                has_override = cur.fetchone() is not None
-                # Finish time type
-                cur.execute(
-                    """
-                    SELECT data_type
+                    SELECT column_name, data_type
                     FROM information_schema.columns
-                    WHERE table_schema='public' AND table_name='race_results' AND column_name='finish_time'
+                    WHERE table_schema='public' AND table_name='race_results'
+                      AND column_name IN ('handicap_override', 'finish_time')
                     """
                 )
-                row = cur.fetchone()
-                finish_type = row[0] if row else None
+                column_types = dict(cur.fetchall())
+        has_override = 'handicap_override' in column_types
+        finish_type = column_types.get('finish_time')
         return {
             'connected': True,
             'status': 'ok',
@@ -474,9 +737,8 @@ def health_handicaps():
     Returns a JSON report with counts and up to 50 examples.
     """
     try:
-        data = load_data()
         # Seed handicap map from fleet starting handicaps
-        fleet_data = data.get('fleet', {}) or {}
+        fleet_data = ds_get_fleet() or {}
         competitors = fleet_data.get('competitors', []) or []
         start_map: dict[str, int] = {
             c.get('competitor_id'): int(c.get('starting_handicap_s_per_hr') or 0)
@@ -484,32 +746,18 @@ def health_handicaps():
         }
         handicap_map: dict[str, int] = dict(start_map)
 
-        # Flatten races and order chronologically (global)
-        race_list: list[dict] = []
-        for season in data.get('seasons', []) or []:
-            for series in season.get('series', []) or []:
-                for race in series.get('races', []) or []:
-                    race_list.append(race)
-        order = _race_order_map()
-        if order:
-            race_list.sort(key=lambda r: order.get(r.get('race_id'), 10**9))
-        else:
-            race_list.sort(key=lambda r: (r.get('date'), r.get('start_time')))
+        # Races streamed one at a time in global chronological order
+        race_list = ds_iter_races_chronological()
 
+        # Only the first 50 mismatches are reported; the rest are just counted
         mismatches: list[dict] = []
-        # Helper to parse times
-        def _p(t: str | None) -> int | None:
-            if not t:
-                return None
-            try:
-                h, m, s = map(int, t.split(':'))
-                return h * 3600 + m * 60 + s
-            except Exception:
-                return None
-
+        mismatch_count = 0
         for race in race_list:
             rid = race.get('race_id')
-            start_seconds = _p(race.get('start_time')) or 0
+            try:
+                start_seconds = _parse_hms(race.get('start_time')) or 0
+            except Exception:
+                start_seconds = 0
             entrants = race.get('competitors', []) or []
             # Check seeds and prepare calc entries using expected initial
             calc_entries: list[dict] = []
@@ -527,19 +775,24 @@ def health_handicaps():
                     expected = handicap_map.get(cid, 0)
                 stored = ent.get('initial_handicap')
                 if stored is None or int(stored) != int(expected):
-                    mismatches.append({
-                        'race_id': rid,
-                        'competitor_id': cid,
-                        'stored_initial': stored,
-                        'expected_initial': expected,
-                        'override': ov,
-                    })
+                    mismatch_count += 1
+                    if mismatch_count <= 50:
+                        mismatches.append({
+                            'race_id': rid,
+                            'competitor_id': cid,
+                            'stored_initial': stored,
+                            'expected_initial': expected,
+                            'override': ov,
+                        })
                 entry = {
                     'competitor_id': cid,
                     'start': start_seconds,
                     'initial_handicap': int(expected),
                 }
-                ft = _p(ent.get('finish_time'))
+                try:
+                    ft = _parse_hms(ent.get('finish_time'))
+                except Exception:
+                    ft = None
                 if ft is not None:
                     entry['finish'] = ft
                 status = ent.get('status')
@@ -560,9 +813,9 @@ def health_handicaps():
                     pass
 
         return {
-            'status': 'ok' if not mismatches else 'mismatch',
-            'mismatch_count': len(mismatches),
-            'examples': mismatches[:50],
+            'status': 'ok' if not mismatch_count else 'mismatch',
+            'mismatch_count': mismatch_count,
+            'examples': mismatches,
         }
     except Exception as e:  # pragma: no cover
         return {'status': 'error', 'error': str(e)}, 500
@@ -574,14 +827,11 @@ def schema_upgrade():
     - Adds race_results.handicap_override if missing
     - Coerces race_results.finish_time to TIME when not already TIME
     """
-    import os
     url = os.environ.get('DATABASE_URL')
     if not url:
         return {'ok': False, 'status': 'no_database_url'}
     try:
-        import psycopg2  # type: ignore
-        from . import datastore_pg as _pg
-        with psycopg2.connect(url, **_pg._connect_kwargs()) as conn:
+        with _pg._get_conn() as conn:
             with conn.cursor() as cur:
                 # Add column if missing
                 cur.execute(
@@ -625,75 +875,96 @@ def schema_upgrade():
                     # Be tolerant if race_results is missing entirely
                     pass
                 conn.commit()
+        # finish_time may have been rewritten in place; drop cached reads
+        ds_invalidate()
         return {'ok': True}
     except Exception as e:  # pragma: no cover
         return {'ok': False, 'status': 'error', 'error': str(e)}
 
+def _create_indexes_for_table(statements: list[str]) -> tuple[list[str], list[dict]]:
+    """Run one table's CREATE INDEX CONCURRENTLY statements in order.
+
+    Uses its own pooled connection in autocommit mode (CONCURRENTLY cannot run
+    inside a transaction). Returns (applied, failed) statement lists.
+    """
+    applied: list[str] = []
+    failed: list[dict] = []
+    with _pg._get_conn() as conn:
+        # The pooled connection goes back to the pool in its default mode
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cur:
+                for sql in statements:
+                    try:
+                        cur.execute(sql)
+                    except Exception as e:
+                        failed.append({'sql': sql, 'error': str(e)})
+                        continue
+                    applied.append(sql)
+        finally:
+            conn.autocommit = False
+    return applied, failed
+
+
 @bp.route('/admin/indexes/apply', methods=['POST'])
 def apply_missing_indexes():
     """Create recommended indexes if missing.
 
     Runs CREATE INDEX CONCURRENTLY IF NOT EXISTS statements for each missing
-    index detected by the same logic as /health/indexes.
+    index detected by the same logic as /health/indexes. Builds on different
+    tables run in parallel; builds on one table would only queue on its lock,
+    so they run in order.
     """
-    import os
     url = os.environ.get('DATABASE_URL')
     if not url:
         return {'ok': False, 'status': 'no_database_url'}
     try:
-        import psycopg2  # type: ignore
-        with psycopg2.connect(url, connect_timeout=5) as conn:
+        with _pg._get_conn() as conn:
             with conn.cursor() as cur:
                 # Inspect existing indexes
-                cur.execute(
-                    """
-                    SELECT tablename, indexname, indexdef
-                    FROM pg_indexes
-                    WHERE schemaname = 'public'
-                      AND tablename IN ('seasons','series','races','race_results','competitors','settings')
-                    ORDER BY tablename, indexname
-                    """
-                )
-                idx = cur.fetchall()
-
-                def has_index(table: str, cols: str) -> bool:
-                    cols_norm = cols.replace(' ', '')
-                    for t, _name, defn in idx:
-                        if t != table:
-                            continue
-                        d = (defn or '').lower().replace(' ', '')
-                        if f'({cols_norm})' in d:
-                            return True
-                    return False
-
-                statements: list[str] = []
-                if not has_index('series', 'season_id'):
-                    statements.append('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_series_season ON public.series(season_id);')
-                # If series_id,date,start_time composite exists, plain series_id is optional
-                if not has_index('races', 'series_id, date, start_time'):
-                    if not has_index('races', 'series_id'):
-                        statements.append('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_races_series ON public.races(series_id);')
-                if not has_index('races', 'date, start_time'):
-                    statements.append('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_races_date_time ON public.races(date, start_time);')
-                if not has_index('races', 'series_id, date, start_time'):
-                    statements.append('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_races_series_date_time ON public.races(series_id, date, start_time);')
-                # Prefer competitor_ref; accept legacy competitor_id for compatibility
-                has_comp_idx = (
-                    has_index('race_results', 'competitor_ref')
-                    or has_index('race_results', 'competitor_ref, race_id')
-                    or has_index('race_results', 'competitor_id')
-                    or has_index('race_results', 'competitor_id, race_id')
-                )
-                if not has_comp_idx:
-                    statements.append('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_results_competitor_ref ON public.race_results(competitor_ref);')
+                idx = _fetch_index_lookup(cur)
 
-                applied: list[str] = []
-                for sql in statements:
-                    cur.execute(sql)
-                    applied.append(sql)
-        return {'ok': True, 'applied': applied}
-    except ImportError:
-        return {'ok': False, 'status': 'client_missing'}
+        def has_index(table: str, cols: str) -> bool:
+            return cols.replace(' ', '').lower() in idx.get(table, ())
+
+        # table -> statements to run on it, in order
+        statements: dict[str, list[str]] = {}
+        if not has_index('series', 'season_id'):
+            statements.setdefault('series', []).append('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_series_season ON public.series(season_id);')
+        # If series_id,date,start_time composite exists, plain series_id is optional
+        if not has_index('races', 'series_id, date, start_time'):
+            if not has_index('races', 'series_id'):
+                statements.setdefault('races', []).append('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_races_series ON public.races(series_id);')
+        if not has_index('races', 'date, start_time'):
+            statements.setdefault('races', []).append('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_races_date_time ON public.races(date, start_time);')
+        if not has_index('races', 'series_id, date, start_time'):
+            statements.setdefault('races', []).append('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_races_series_date_time ON public.races(series_id, date, start_time);')
+        # Prefer competitor_ref; accept legacy competitor_id for compatibility
+        has_comp_idx = (
+            has_index('race_results', 'competitor_ref')
+            or has_index('race_results', 'competitor_ref, race_id')
+            or has_index('race_results', 'competitor_id')
+            or has_index('race_results', 'competitor_id, race_id')
+        )
+        if not has_comp_idx:
+            statements.setdefault('race_results', []).append('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_results_competitor_ref ON public.race_results(competitor_ref);')
+
+        applied: list[str] = []
+        failed: list[dict] = []
+        started = time.monotonic()
+        if statements:
+            with ThreadPoolExecutor(max_workers=len(statements)) as pool:
+                for table_applied, table_failed in pool.map(_create_indexes_for_table, statements.values()):
+                    applied.extend(table_applied)
+                    failed.extend(table_failed)
+        result = {
+            'ok': not failed,
+            'applied': applied,
+            'elapsed_s': round(time.monotonic() - started, 3),
+        }
+        if failed:
+            result['failed'] = failed
+        return result
     except Exception as e:  # pragma: no cover
         return {'ok': False, 'status': 'error', 'error': str(e)}
 
@@ -717,8 +988,24 @@ def _load_series_entries():
 
 #<getdata>
 def _load_all_races():
-    """Return a flat list of all races with series info from data.json."""
-    return ds_list_all_races()
+    """Return a flat list of all races with series info from data.json.
+
+    The list is cached until the next write and must not be mutated.
+    """
+    return _cached_meta('all_races', lambda: ds_list_all_races() or [])
+
+
+def _sorted_all_races() -> list[dict]:
+    """Return ``_load_all_races()`` in chronological order (shared, read only)."""
+    return _cached_meta('all_races_sorted', _load_sorted_all_races)
+
+
+def _load_sorted_all_races() -> list[dict]:
+    order = _race_order_map()
+    all_races = _load_all_races()
+    if not order:
+        return all_races
+    return sorted(all_races, key=lambda r: order.get(r.get('race_id'), 10**9))
 #</getdata>
 
 
@@ -729,31 +1016,144 @@ def _find_series(series_id: str):
     if not series:
         return None, None
     meta = {"series_id": series.get("series_id"), "name": series.get("name"), "season": series.get("season")}
-    return meta, list(series.get("races", []))
+    # Callers only read the races; no defensive copy
+    return meta, series.get("races", [])
 #</getdata>
 
 
 #<getdata>
 def _find_race(race_id: str):
-    """Return race data for the given race id or None if not found."""
-    _season, _series, race = ds_find_race(race_id)
-    return race
+    """Return race data for the given race id or None if not found.
+
+    The race comes from the shared read-only tree; callers get a shallow copy
+    so they may attach display fields such as ``results``.
+    """
+    _season, _series, race = ds_find_race_indexed(race_id)
+    return dict(race) if race is not None else None
 #</getdata>
 
 
+@functools.lru_cache(maxsize=8192)
 def _parse_hms(t: str | None) -> int | None:
-    """Return seconds for an ``HH:MM:SS`` timestamp or ``None``."""
+    """Return seconds for an ``HH:MM:SS`` timestamp or ``None``.
+
+    Memoized: a season only has a few hundred distinct time strings.
+    """
     if not t:
         return None
+    if len(t) == 8 and t[2] == ":" and t[5] == ":":
+        return int(t[0:2]) * 3600 + int(t[3:5]) * 60 + int(t[6:8])
     h, m, s = map(int, t.split(":"))
     return h * 3600 + m * 60 + s
 
 
+def _format_hms(seconds: float | None) -> str | None:
+    """Return ``HH:MM:SS`` for a number of seconds or ``None``."""
+    if seconds is None:
+        return None
+    total = int(round(seconds))
+    h = total // 3600
+    m = (total % 3600) // 60
+    s = total % 60
+    return f"{h:02d}:{m:02d}:{s:02d}"
+
+
+def _ordered_competitor_ids(fleet: list[dict], entrants_map: dict[int, dict]) -> list[int]:
+    """Return fleet competitor ids in fleet order, then any other entrants."""
+    # A dict keeps first-seen order with O(1) membership checks
+    ordered = dict.fromkeys(
+        int(comp['competitor_id']) for comp in fleet if comp.get('competitor_id') is not None
+    )
+    ordered.update(dict.fromkeys(entrants_map))
+    return list(ordered)
+
+
+@dataclass(slots=True)
+class RaceResultRow:
+    """One competitor's row on the race sheet / preview.
+
+    Slotted so a large fleet does not allocate a fresh 16-key dict per
+    competitor; templates read the fields as attributes and Flask's JSON
+    provider serializes it like the dict it replaces.
+    """
+
+    finish_time: str | None
+    on_course_secs: float | None
+    elapsed_time: str | None
+    abs_pos: int | None
+    allowance: float | None
+    adj_time_secs: float | None
+    adj_time: str | None
+    hcp_pos: int | None
+    race_pts: float | None
+    league_pts: float | None
+    full_delta: float | None
+    scaled_delta: float | None
+    actual_delta: float | None
+    revised_hcp: int | None
+    place: str | None
+    handicap_override: int | None
+
+
+def _result_row(res: dict, entrant: dict, finisher_count: int) -> RaceResultRow:
+    """Shape one ``calculate_race_results`` row for the race sheet / preview.
+
+    Each field is read from ``res`` once; non-finishers get the display
+    fallbacks (fleet-size + 1 race points, zero deltas, unchanged handicap).
+    """
+    nf = res.get('finish') is None
+    elapsed_secs = res.get('elapsed_seconds')
+    adj_secs = res.get('adjusted_time_seconds')
+    trad_pts = res.get('traditional_points')
+    points = res.get('points')
+    full_delta = res.get('full_delta')
+    scaled_delta = res.get('scaled_delta')
+    actual_delta = res.get('actual_delta')
+    revised = res.get('revised_handicap')
+    return RaceResultRow(
+        finish_time=entrant.get('finish_time'),
+        on_course_secs=elapsed_secs,
+        elapsed_time=(_format_hms(elapsed_secs) if (elapsed_secs and elapsed_secs > 0) else None),
+        abs_pos=res.get('absolute_position'),
+        allowance=res.get('allowance_seconds'),
+        adj_time_secs=adj_secs,
+        adj_time=(_format_hms(adj_secs) if not nf else None),
+        hcp_pos=res.get('handicap_position'),
+        race_pts=trad_pts if trad_pts is not None else (finisher_count + 1 if nf else None),
+        league_pts=points if points is not None else (0.0 if nf else None),
+        full_delta=full_delta if full_delta is not None else (0 if nf else None),
+        scaled_delta=scaled_delta if scaled_delta is not None else (0 if nf else None),
+        actual_delta=actual_delta if actual_delta is not None else (0 if nf else None),
+        revised_hcp=revised if revised is not None else (res.get('initial_handicap') if nf else None),
+        place=res.get('status'),
+        handicap_override=entrant.get('handicap_override'),
+    )
+
+
+def _cached_meta(name: str, build):
+    """Return ``build()``, reusing it until the next write or ``CACHE_TTL_META``.
+
+    Callers share the returned mapping and must not mutate it.
+    """
+    gen = ds_generation()
+    hit = _META_CACHE.get(name)
+    if hit is not None and hit[0] == gen:
+        return hit[1]
+    value = build()
+    _META_CACHE.set(name, (gen, value))
+    return value
+
+
 def _race_order_map() -> dict[str, int]:
     """Return mapping race_id -> chronological index (0=earliest).
 
-    Uses datastore.get_races(); returns empty dict on failure.
+    Uses datastore.get_races(); returns empty dict on failure. The mapping is
+    cached until the next write and must not be mutated.
     """
+    return _cached_meta('race_order', _load_race_order_map)
+
+
+def _load_race_order_map() -> dict[str, int]:
     try:
         ids = ds_get_races() or []
         return {rid: idx for idx, rid in enumerate(ids) if rid}
@@ -768,7 +1168,12 @@ def _fleet_lookup() -> dict:
     Keys are the competitor_id values as provided by the datastore. In the
     production Postgres path these are integers. In tests (patched datastore),
     they may be strings. No sail-number derived fallbacks are produced.
+    The mapping is cached until the next write and must not be mutated.
     """
+    return _cached_meta('fleet', _load_fleet_lookup)
+
+
+def _load_fleet_lookup() -> dict:
     fleet = ds_get_fleet() or {"competitors": []}
     competitors = fleet.get("competitors", []) or []
     mapping = {}
@@ -789,7 +1194,10 @@ def build_pre_race_snapshot(race_id: str, data: dict | None = None) -> dict[int,
     are honored. Seeds are taken from fleet starting handicaps.
     """
     # Resolve season and ordered race ids
-    season_obj, _series_obj, _race_obj = ds_find_race(race_id, data=data)
+    if data is None:
+        season_obj, _series_obj, _race_obj = ds_find_race_indexed(race_id)
+    else:
+        season_obj, _series_obj, _race_obj = ds_find_race(race_id, data=data)
     if not _race_obj:
         return {}
     try:
@@ -819,7 +1227,11 @@ def build_pre_race_snapshot(race_id: str, data: dict | None = None) -> dict[int,
     prior_ids = ids[:idx] if idx > 0 else []
 
     # Seed map from fleet starting handicaps
-    fleet = (data.get('fleet') if isinstance(data, dict) else ds_get_fleet()).get('competitors', [])
+    if isinstance(data, dict):
+        fleet = data.get('fleet', {}).get('competitors', [])
+    else:
+        # Shared, write-invalidated lookup; read only
+        fleet = _fleet_lookup().values()
     fleet_map = {int(c.get('competitor_id')): c for c in (fleet or []) if c.get('competitor_id') is not None}
     handicap_map: dict[int, int] = {
         int(cid): int(c.get('starting_handicap_s_per_hr') or 0)
@@ -829,10 +1241,23 @@ def build_pre_race_snapshot(race_id: str, data: dict | None = None) -> dict[int,
     if not prior_ids:
         return handicap_map
 
+    # Resume from the latest cached post-race map; only a caller-supplied
+    # (possibly unsaved) tree bypasses the cache
+    use_cache = data is None
+    gen = ds_generation()
+    if use_cache:
+        for pos in range(len(prior_ids) - 1, -1, -1):
+            hit = _SNAPSHOT_CACHE.get((season_year, prior_ids[pos]))
+            if hit is not None and hit[0] == gen:
+                handicap_map = dict(hit[1])
+                prior_ids = prior_ids[pos + 1:]
+                break
+        if not prior_ids:
+            return handicap_map
+
     # Try bulk fetch of prior races with entries (PostgreSQL path)
     races_data: dict[str, dict] | None = None
     try:
-        from . import datastore_pg as _pg  # type: ignore
         if hasattr(_pg, 'get_races_with_entries'):
             races_data = _pg.get_races_with_entries(prior_ids)  # type: ignore[attr-defined]
     except Exception:
@@ -844,11 +1269,11 @@ def build_pre_race_snapshot(race_id: str, data: dict | None = None) -> dict[int,
             for rid in prior_ids:
                 r = races_data.get(str(rid)) or {}
                 if r:
-                    yield r
+                    yield {**r, 'race_id': rid}
         else:
             # Fallback: load from data tree
             try:
-                tree = data if isinstance(data, dict) else load_data()
+                tree = data if isinstance(data, dict) else load_data(readonly=True)
             except Exception:
                 tree = {"seasons": []}
             race_list: list[dict] = []
@@ -924,20 +1349,21 @@ def build_pre_race_snapshot(race_id: str, data: dict | None = None) -> dict[int,
             if status:
                 entry['status'] = status
             entries.append(entry)
-        if not entries:
-            continue
-        try:
-            results = calculate_race_results(entries)
-        except Exception:
-            results = []
-        for res in results:
-            cid2 = res.get('competitor_id')
-            rev = res.get('revised_handicap')
-            if cid2 is not None and rev is not None:
-                try:
-                    handicap_map[int(cid2)] = int(rev)
-                except Exception:
-                    pass
+        if entries:
+            try:
+                results = calculate_race_results(entries)
+            except Exception:
+                results = []
+            for res in results:
+                cid2 = res.get('competitor_id')
+                rev = res.get('revised_handicap')
+                if cid2 is not None and rev is not None:
+                    try:
+                        handicap_map[int(cid2)] = int(rev)
+                    except Exception:
+                        pass
+        if use_cache and r.get('race_id'):
+            _SNAPSHOT_CACHE.set((season_year, str(r['race_id'])), (gen, dict(handicap_map)))
 
     return handicap_map
 #</getdata>
@@ -945,6 +1371,52 @@ def build_pre_race_snapshot(race_id: str, data: dict | None = None) -> dict[int,
 
 
 #<getdata>
+def _replay_race(race: dict, handicap_map: dict) -> dict:
+    """Return the pre-race seeds for ``race`` and feed its results forward.
+
+    Each entrant is seeded with its ``handicap_override`` (which also becomes
+    the competitor's running handicap) or else the running handicap from
+    ``handicap_map``. The race's revised handicaps are then written back into
+    ``handicap_map`` for the races that follow.
+    """
+    start_seconds = _parse_hms(race.get("start_time")) or 0
+    seeds: dict = {}
+    calc_entries: list[dict] = []
+    for ent in race.get("competitors", []) or []:
+        cid = ent.get("competitor_id")
+        if not cid:
+            continue
+        override = ent.get("handicap_override")
+        if override is not None:
+            initial = int(override)
+            handicap_map[cid] = initial
+        else:
+            initial = handicap_map.get(cid, 0)
+        seeds[cid] = initial
+        entry = {
+            "competitor_id": cid,
+            "start": start_seconds,
+            "initial_handicap": initial,
+        }
+        ft = ent.get("finish_time")
+        if ft:
+            parsed = _parse_hms(ft)
+            if parsed is not None:
+                entry["finish"] = parsed
+        status = ent.get("status")
+        if status:
+            entry["status"] = status
+        calc_entries.append(entry)
+
+    if calc_entries:
+        handicap_map.update({
+            res["competitor_id"]: res["revised_handicap"]
+            for res in calculate_race_results(calc_entries)
+            if res.get("competitor_id") and res.get("revised_handicap") is not None
+        })
+    return seeds
+
+
 def recalculate_handicaps() -> None:
     """Recompute starting handicaps for all races from revised results.
 
@@ -954,6 +1426,16 @@ def recalculate_handicaps() -> None:
     handicaps produced from the race are then fed forward to subsequent races
     and ultimately written back to the fleet register.
     """
+    try:
+        stream = _pg.iter_races_chronological()
+        first = next(stream, None)
+    except Exception:
+        # PostgreSQL unavailable (e.g., patched datastore in tests)
+        stream = None
+    if stream is not None:
+        _recalculate_handicaps_pg([] if first is None else itertools.chain((first,), stream))
+        return
+
     data = load_data()
     fleet_data = data.get("fleet", {"competitors": []})
     competitors = fleet_data.get("competitors", [])
@@ -963,72 +1445,36 @@ def recalculate_handicaps() -> None:
         if c.get("competitor_id")
     }
 
-    # Build list of (race_obj) across all seasons/series
-    race_list: list[dict] = []
-    for season in data.get("seasons", []):
-        for series in season.get("series", []):
-            for race in series.get("races", []):
-                race_list.append(race)
-
-    order = _race_order_map()
-    if order:
-        race_list.sort(key=lambda r: order.get(r.get("race_id"), 10**9))
-    else:
-        race_list.sort(key=lambda r: (r.get("date"), r.get("start_time")))
+    # Races of this (mutable) tree in global chronological order
+    race_list = ds_get_sorted_races(data)
 
-    # Collect per-race pre-seeded initial handicaps for robust persistence
-    pre_by_race: dict[str, dict[str, int]] = {}
+    # Whether any stored seed or current handicap differs from the replay
+    changed = False
 
     for race in race_list:
-        start_seconds = _parse_hms(race.get("start_time")) or 0
-        calc_entries: list[dict] = []
-        for ent in race.get("competitors", []):
+        seeds = _replay_race(race, handicap_map)
+        for ent in race.get("competitors", []) or []:
             cid = ent.get("competitor_id")
             if not cid:
                 continue
-            override = ent.get("handicap_override")
-            if override is not None:
-                initial = int(override)
-                handicap_map[cid] = initial
-            else:
-                initial = handicap_map.get(cid, 0)
+            initial = seeds[cid]
+            if ent.get("initial_handicap") != initial:
+                changed = True
             ent["initial_handicap"] = initial
-            # Track the computed pre-race seed for this entrant
-            rid = str(race.get("race_id") or "")
-            if rid:
-                pre_by_race.setdefault(rid, {})[cid] = int(initial)
-            entry = {
-                "competitor_id": cid,
-                "start": start_seconds,
-                "initial_handicap": initial,
-            }
-            ft = ent.get("finish_time")
-            if ft:
-                parsed = _parse_hms(ft)
-                if parsed is not None:
-                    entry["finish"] = parsed
-            status = ent.get("status")
-            if status:
-                entry["status"] = status
-            calc_entries.append(entry)
-
-        if calc_entries:
-            results = calculate_race_results(calc_entries)
-            for res in results:
-                cid = res.get("competitor_id")
-                revised = res.get("revised_handicap")
-                if cid and revised is not None:
-                    handicap_map[cid] = revised
 
     for comp in competitors:
         cid = comp.get("competitor_id")
         if cid:
-            comp["current_handicap_s_per_hr"] = handicap_map.get(
-                cid, comp.get("current_handicap_s_per_hr", 0)
-            )
+            current = handicap_map.get(cid, comp.get("current_handicap_s_per_hr", 0))
+            if comp.get("current_handicap_s_per_hr") != current:
+                changed = True
+            comp["current_handicap_s_per_hr"] = current
+
+    if not changed:
+        # Stored seeds and fleet handicaps already match the replay
+        return
 
     data["fleet"] = fleet_data
-    # Persist via JSON-like path for in-memory/testing backends.
     # Write only the sections we actually changed: seasons (race seeds) and fleet.
     try:
         save_data({
@@ -1039,28 +1485,44 @@ def recalculate_handicaps() -> None:
         # Best-effort: do not fail if JSON-like save is unavailable
         pass
 
-    # Additionally, apply targeted SQL updates to ensure PostgreSQL rows are in sync
-    try:
-        from . import datastore_pg as _pg
-        # Build final current handicap map from fleet_data after recalc
-        fleet_current: dict[str, int] = {}
-        for c in fleet_data.get("competitors", []) or []:
-            cid = c.get("competitor_id")
-            if cid:
-                try:
-                    fleet_current[cid] = int(c.get("current_handicap_s_per_hr") or 0)
-                except Exception:
-                    pass
-        if pre_by_race:
-            _pg.apply_recalculated_handicaps(pre_by_race, fleet_current)
-    except Exception:
-        # If Postgres helpers are unavailable (e.g., during tests), ignore
-        pass
+
+def _recalculate_handicaps_pg(races) -> None:
+    """PostgreSQL path of ``recalculate_handicaps``.
+
+    Replays ``races`` (streamed in chronological order) without loading the
+    full tree, then writes every changed seed and fleet handicap in one
+    ``apply_recalculated_handicaps`` batch instead of a ``save_data`` rewrite.
+    """
+    competitors = (ds_get_fleet() or {}).get("competitors", []) or []
+    handicap_map = {
+        c.get("competitor_id"): c.get("starting_handicap_s_per_hr", 0)
+        for c in competitors
+        if c.get("competitor_id")
+    }
+
+    # (race_id, competitor_id, seed) rows for the batch update
+    seed_rows: list[tuple[str, int, int]] = []
+    for race in races:
+        seeds = _replay_race(race, handicap_map)
+        rid = str(race.get("race_id") or "")
+        if rid:
+            seed_rows.extend((rid, int(cid), int(seed)) for cid, seed in seeds.items())
+
+    fleet_current: dict = {}
+    for comp in competitors:
+        cid = comp.get("competitor_id")
+        if cid:
+            try:
+                fleet_current[cid] = int(handicap_map.get(cid, comp.get("current_handicap_s_per_hr")) or 0)
+            except (TypeError, ValueError):
+                pass
+
+    ds_apply_recalculated_handicaps(seed_rows, fleet_current)
 #</getdata>
 
 
 #<getdata>
-def recalculate_handicaps_from(start_race_id: str) -> None:
+def recalculate_handicaps_from(start_race_id: str, season_year: int | None = None) -> None:
     """Forward-only recalculation starting from a specific race.
 
     - Uses persisted initial_handicap values for the start race as the
@@ -1069,13 +1531,14 @@ def recalculate_handicaps_from(start_race_id: str) -> None:
     - Writes updated pre-race seeds for affected races and updates fleet
       current handicaps for competitors impacted in the forward pass
     """
-    # Determine the season for the starting race and constrain recalculation
-    # to that season's races only.
-    try:
-        season_obj, _series_obj, _race_obj = ds_find_race(start_race_id)
-        season_year = int((season_obj or {}).get('year')) if season_obj and season_obj.get('year') is not None else None
-    except Exception:
-        season_year = None
+    # Determine the season for the starting race (unless the caller already
+    # knows it) and constrain recalculation to that season's races only.
+    if season_year is None:
+        try:
+            season_obj, _series_obj, _race_obj = ds_find_race(start_race_id)
+            season_year = int((season_obj or {}).get('year')) if season_obj and season_obj.get('year') is not None else None
+        except Exception:
+            season_year = None
 
     try:
         if season_year is not None:
@@ -1102,35 +1565,27 @@ def recalculate_handicaps_from(start_race_id: str) -> None:
     if not forward_ids:
         return
 
-    pre_by_race: dict[str, dict[int, int]] = {}
+    # (race_id, competitor_id, seed) rows for the batch update
+    seed_rows: list[tuple[str, int, int]] = []
     revised_latest: dict[int, int] = {}
 
-    # Try to bulk-load race metadata + entrants for all forward races (PostgreSQL path)
-    race_map: dict[str, dict] | None = None
-    try:
-        from . import datastore_pg as _pg  # type: ignore
-        if hasattr(_pg, 'get_races_with_entries'):
-            race_map = _pg.get_races_with_entries(forward_ids)  # type: ignore[attr-defined]
-    except Exception:
-        race_map = None
+    # Load race metadata + entrants for all forward races in one fetch
+    race_map = ds_find_races(forward_ids)
 
     for rid in forward_ids:
-        # Prefer bulk-fetched data when available; else fall back to single fetch
-        if race_map is not None and str(rid) in race_map:
-            race = race_map.get(str(rid)) or {}
-        else:
-            _season, _series, race = ds_find_race(rid)
-            if not race:
-                continue
+        race = race_map.get(str(rid))
+        if not race:
+            continue
         start_seconds = _parse_hms(race.get('start_time')) or 0
         entrants = race.get('competitors', []) or []
         calc_entries: list[dict] = []
-        seeds_for_race: dict[int, int] = {}
+        race_key = str(rid)
 
         for ent in entrants:
             cid = ent.get('competitor_id')
             if cid is None:
                 continue
+            cid = int(cid)
             initial = None
             ov = ent.get('handicap_override')
             if ov is not None:
@@ -1140,16 +1595,15 @@ def recalculate_handicaps_from(start_race_id: str) -> None:
                     initial = None
             if initial is None:
                 # If we have a revised handicap from a prior race in this forward pass, prefer it
-                if int(cid) in revised_latest:
-                    initial = int(revised_latest[int(cid)])
-                else:
+                initial = revised_latest.get(cid)
+                if initial is None:
                     ih = ent.get('initial_handicap')
                     try:
                         initial = int(ih) if ih is not None else None
                     except Exception:
                         initial = None
             entry = {
-                'competitor_id': int(cid),
+                'competitor_id': cid,
                 'start': start_seconds,
                 'initial_handicap': initial,
             }
@@ -1166,7 +1620,7 @@ def recalculate_handicaps_from(start_race_id: str) -> None:
 
             calc_entries.append(entry)
             if initial is not None:
-                seeds_for_race[int(cid)] = int(initial)
+                seed_rows.append((race_key, cid, initial))
 
         if calc_entries:
             results = calculate_race_results(calc_entries)
@@ -1176,16 +1630,12 @@ def recalculate_handicaps_from(start_race_id: str) -> None:
                 if cid is not None and revised is not None:
                     revised_latest[int(cid)] = int(revised)
 
-        if seeds_for_race:
-            pre_by_race[str(rid)] = seeds_for_race
-
     # Build a partial fleet current map for touched competitors
     fleet_current: dict[int, int] = {cid: h for cid, h in revised_latest.items()}
 
     try:
-        from . import datastore_pg as _pg
-        if pre_by_race:
-            _pg.apply_recalculated_handicaps(pre_by_race, fleet_current)
+        if seed_rows or fleet_current:
+            ds_apply_recalculated_handicaps(seed_rows, fleet_current)
     except Exception:
         # If Postgres helpers are unavailable (e.g., during tests), ignore
         pass
@@ -1194,6 +1644,7 @@ def recalculate_handicaps_from(start_race_id: str) -> None:
 def _season_standings(season: int, scoring: str) -> tuple[list[dict], list[dict]]:
     """Compute standings and per-race metadata for a season."""
     fleet = _fleet_lookup()
+    order = _race_order_map()
     race_groups: list[dict] = []
 
     season_obj = ds_list_season_races_with_results(int(season)) or {"series": []}
@@ -1234,7 +1685,7 @@ def _season_standings(season: int, scoring: str) -> tuple[list[dict], list[dict]
                         if status:
                             entry["status"] = status
                     entries.append(entry)
-                results = calculate_race_results(entries)
+                results = _race_results_by_content(race.get("race_id"), entries)
                 group["races"].append(
                     {
                         "race_id": race.get("race_id"),
@@ -1244,9 +1695,8 @@ def _season_standings(season: int, scoring: str) -> tuple[list[dict], list[dict]
                     }
                 )
             if group["races"]:
-                order = _race_order_map()
                 if order:
-                    group["races"].sort(key=lambda r: order.get(r.get("race_id"), 10**9))
+                    group["races"].sort(key=lambda r: order.get(r["race_id"], 10**9))
                 else:
                     group["races"].sort(key=lambda r: (r["date"] or "", r["start_time"] or ""))
                 race_groups.append(group)
@@ -1263,110 +1713,119 @@ def _season_standings(season: int, scoring: str) -> tuple[list[dict], list[dict]
         )
     race_groups.sort(key=_first_race_key)
 
-    aggregates: dict[str, dict] = {}
+    # Aggregate per competitor in a single pass over all results. Each
+    # competitor gets a dense index on first appearance and the accumulators
+    # are parallel lists indexed by it. The scoring mode is resolved once;
+    # series totals (and, for traditional, finish counts) run alongside, and
+    # traditional per-series results are kept as (race_id, points, finished)
+    # tuples only for the drop calculation below.
+    traditional = scoring == "traditional"
+    cid_index: dict = {}
+    identity: list[tuple] = []
+    race_count: list[int] = []
+    league_total: list[float] = []
+    race_points: list[dict] = []
+    race_finished: list[dict] = []
+    series_totals_by: list[dict[int, float]] = []
+    series_counts_by: list[dict[int, int]] = []
+    series_results_by: list[dict[int, list[tuple]]] = []
     for idx, group in enumerate(race_groups):
         for race in group["races"]:
-            finisher_count = sum(1 for r in race["results"] if r.get("finish") is not None)
-            for res in race["results"]:
+            race_id = race["race_id"]
+            results = race["results"]
+            finisher_count = None
+            for res in results:
                 cid = res.get("competitor_id")
-                agg = aggregates.setdefault(
-                    cid,
-                    {
-                        "sailor": res.get("sailor"),
-                        "boat": res.get("boat"),
-                        "sail_number": res.get("sail_number"),
-                        "race_count": 0,
-                        "league_points": 0.0,
-                        "traditional_points": 0.0,
-                        "race_points": {},
-                        "series_totals": {},
-                        "series_results": {},
-                        "dropped_races": set(),
-                        "race_finished": {},
-                    },
-                )
+                i = cid_index.get(cid)
+                if i is None:
+                    i = cid_index[cid] = len(identity)
+                    identity.append((res.get("sailor"), res.get("boat"), res.get("sail_number")))
+                    race_count.append(0)
+                    league_total.append(0.0)
+                    race_points.append({})
+                    race_finished.append({})
+                    series_totals_by.append({})
+                    series_counts_by.append({})
+                    series_results_by.append({})
                 finished = res.get("finish") is not None
                 if finished:
-                    agg["race_count"] += 1
+                    race_count[i] += 1
                 league_pts = res.get("points", 0.0)
-                trad_pts = res.get("traditional_points")
-                if trad_pts is None and res.get("finish") is None:
-                    trad_pts = finisher_count + 1
-                elif trad_pts is None:
-                    trad_pts = 0.0
-                agg["league_points"] += league_pts
-                agg["traditional_points"] += trad_pts
-                if scoring == "traditional":
-                    agg["race_points"][race["race_id"]] = trad_pts
-                    series_list = agg["series_results"].setdefault(idx, [])
-                    series_list.append(
-                        {
-                            "race_id": race["race_id"],
-                            "points": trad_pts,
-                            "finished": finished,
-                        }
-                    )
+                league_total[i] += league_pts
+                if traditional:
+                    trad_pts = res.get("traditional_points")
+                    if trad_pts is None:
+                        if finished:
+                            trad_pts = 0.0
+                        else:
+                            if finisher_count is None:
+                                finisher_count = sum(1 for r in results if r.get("finish") is not None)
+                            trad_pts = finisher_count + 1
+                    race_points[i][race_id] = trad_pts
+                    totals = series_totals_by[i]
+                    totals[idx] = totals.get(idx, 0.0) + trad_pts
+                    counts = series_counts_by[i]
+                    counts[idx] = counts.get(idx, 0) + finished
+                    series_results = series_results_by[i]
+                    if idx in series_results:
+                        series_results[idx].append((race_id, trad_pts, finished))
+                    else:
+                        series_results[idx] = [(race_id, trad_pts, finished)]
                 else:
-                    agg["race_points"][race["race_id"]] = league_pts
-                    agg["series_totals"][idx] = agg["series_totals"].get(idx, 0.0) + league_pts
-                agg["race_finished"][race["race_id"]] = finished
+                    race_points[i][race_id] = league_pts
+                    totals = series_totals_by[i]
+                    totals[idx] = totals.get(idx, 0.0) + league_pts
+                race_finished[i][race_id] = finished
 
     standings: list[dict] = []
-    for agg in aggregates.values():
-        if scoring == "traditional":
-            series_totals: dict[int, float] = {}
-            series_counts: dict[int, int] = {}
+    for i, (sailor, boat, sail_number) in enumerate(identity):
+        if traditional:
+            # Raw totals less the dropped races' points
+            series_totals = series_totals_by[i]
+            series_counts = series_counts_by[i]
             dropped: set[str] = set()
-            for sidx, results in agg["series_results"].items():
-                raw_total = sum(r["points"] for r in results)
-                finish_count = sum(1 for r in results if r["finished"])
-                series_counts[sidx] = finish_count
+            for sidx, finish_count in series_counts.items():
                 if finish_count > 4:
                     drop_n = 2
                 elif finish_count == 4:
                     drop_n = 1
                 else:
-                    drop_n = 0
-                drop_points = 0.0
-                if drop_n:
-                    sorted_res = sorted(results, key=lambda r: r["points"], reverse=True)
-                    to_drop = sorted_res[:drop_n]
-                    drop_points = sum(r["points"] for r in to_drop)
-                    dropped.update(r["race_id"] for r in to_drop)
-                series_totals[sidx] = raw_total - drop_points
-            total = sum(series_totals.values())
+                    continue
+                # Same picks as sorted(..., reverse=True)[:drop_n], ties included
+                to_drop = heapq.nlargest(drop_n, series_results_by[i][sidx], key=operator.itemgetter(1))
+                series_totals[sidx] -= sum(pts for _rid, pts, _fin in to_drop)
+                dropped.update(rid for rid, _pts, _fin in to_drop)
             standings.append(
                 {
-                    "sailor": agg["sailor"],
-                    "boat": agg["boat"],
-                    "sail_number": agg["sail_number"],
-                    "race_count": agg["race_count"],
-                    "total_points": total,
-                    "race_points": agg["race_points"],
+                    "sailor": sailor,
+                    "boat": boat,
+                    "sail_number": sail_number,
+                    "race_count": race_count[i],
+                    "total_points": sum(series_totals.values()),
+                    "race_points": race_points[i],
                     "series_totals": series_totals,
                     "series_counts": series_counts,
                     "dropped_races": dropped,
-                    "race_finished": agg["race_finished"],
+                    "race_finished": race_finished[i],
                 }
             )
         else:
-            total = agg["league_points"]
             standings.append(
                 {
-                    "sailor": agg["sailor"],
-                    "boat": agg["boat"],
-                    "sail_number": agg["sail_number"],
-                    "race_count": agg["race_count"],
-                    "total_points": total,
-                    "race_points": agg["race_points"],
-                    "series_totals": agg["series_totals"],
+                    "sailor": sailor,
+                    "boat": boat,
+                    "sail_number": sail_number,
+                    "race_count": race_count[i],
+                    "total_points": league_total[i],
+                    "race_points": race_points[i],
+                    "series_totals": series_totals_by[i],
                     "series_counts": {},
                     "dropped_races": set(),
-                    "race_finished": agg["race_finished"],
+                    "race_finished": race_finished[i],
                 }
             )
 
-    if scoring == "traditional":
+    if traditional:
         standings.sort(key=lambda r: (r["total_points"], -r["race_count"], r["sailor"]))
     else:
         standings.sort(key=lambda r: (-r["total_points"], -r["race_count"], r["sailor"]))
@@ -1393,16 +1852,22 @@ def index():
 
 
 @bp.route('/races')
+@_cache_response
 def races():
     season = request.args.get('season') or None
     #<getdata>
     all_races = _load_all_races()
     #</getdata>
-    seasons = sorted({r.get('season') for r in all_races if r.get('season')}, reverse=True)
-    if season:
-        race_list = [r for r in all_races if str(r.get('season')) == str(season)]
-    else:
-        race_list = all_races
+    # One pass collects the season choices and applies the season filter
+    season_set: set = set()
+    race_list = [] if season else all_races
+    for r in all_races:
+        year = r.get('season')
+        if year:
+            season_set.add(year)
+        if season and str(year) == season:
+            race_list.append(r)
+    seasons = sorted(season_set, reverse=True)
     breadcrumbs = [('Races', None)]
     return render_template(
         'races.html',
@@ -1462,23 +1927,6 @@ def db_browser():
     )
 
 
-#<getdata>
-def _load_series_meta(series_id: str):
-    """Return (path, data) for the given series id or (None, None).
-
-    Comparison is case-insensitive to tolerate differing user input.
-    """
-    target = series_id.lower()
-    for meta_path in _series_meta_paths():
-        with meta_path.open() as f:
-            data = json.load(f)
-        sid = data.get("series_id")
-        if sid and sid.lower() == target:
-            return meta_path, data
-    return None, None
-#</getdata>
-
-
 ## File-based renumber helper removed (JSON backend retired)
 
 
@@ -1527,6 +1975,7 @@ def race_new():
 
 
 @bp.route('/series/<series_id>')
+@_cache_response
 def series_detail(series_id):
     series, races = _find_series(series_id)
     if series is None:
@@ -1540,35 +1989,17 @@ def series_detail(series_id):
     finisher_count = 0
     fleet = []
     fleet_adjustment = 0
-
-    def _parse_hms(t: str | None) -> int | None:
-        if not t:
-            return None
-        h, m, s = map(int, t.split(":"))
-        return h * 3600 + m * 60 + s
-
-    def _format_hms(seconds: float | None) -> str | None:
-        if seconds is None:
-            return None
-        total = int(round(seconds))
-        h = total // 3600
-        m = (total % 3600) // 60
-        s = total % 60
-        return f"{h:02d}:{m:02d}:{s:02d}"
+    # Season-scoped seeds for the selected race, reused for the template payload
+    pre_race_seeds_full: dict[int, int] | None = None
 
     if race_id:
         #<getdata>
-        # Load baseline handicaps from fleet register
-        fleet = ds_get_fleet().get('competitors', [])
-        handicap_map = {
-            comp.get('competitor_id'): comp.get('starting_handicap_s_per_hr', 0)
-            for comp in fleet
-            if comp.get('competitor_id')
-        }
+        # Load baseline handicaps from fleet register (shared lookup, read only)
+        fleet = list(_fleet_lookup().values())
         errors: list[str] = []
 
-        # Selected race: compute using a chronologically correct snapshot
-        skip_heavy = False
+        # Selected race: compute using a chronologically correct snapshot.
+        # An unknown race id leaves selected_race unset.
         race = _find_race(race_id)
         if race is not None:
             # Validate start time format when finishers present
@@ -1586,17 +2017,11 @@ def series_detail(series_id):
                 int(e.get('competitor_id')): e for e in entrants if e.get('competitor_id') is not None
             }
 
-            ordered_ids: list[int] = []
-            for comp in fleet:
-                cid = comp.get('competitor_id')
-                if cid is not None:
-                    ordered_ids.append(int(cid))
-            for cid in entrants_map.keys():
-                if cid not in ordered_ids:
-                    ordered_ids.append(cid)
+            ordered_ids = _ordered_competitor_ids(fleet, entrants_map)
 
             # Build per-race snapshot for correct pre-race seeds
             pre_race_handicaps: dict[int, int] = build_pre_race_snapshot(race_id)
+            pre_race_seeds_full = pre_race_handicaps
 
             # Compute results for selected race using the snapshot
             if errors:
@@ -1660,228 +2085,21 @@ def series_detail(series_id):
                     calc_entries.append(entry)
 
             results_list = [] if errors else calculate_race_results(calc_entries)
-            finisher_count = sum(1 for r in results_list if r.get('finish') is not None)
-            fleet_adjustment = int(round(_scaling_factor(finisher_count) * 100)) if finisher_count else 0
-
-            results: dict[int, dict] = {}
+            # Finishers precede non-finishers in results_list, so the running
+            # count is complete by the time a non-finisher row needs it.
+            finisher_count = 0
+            results: dict[int, RaceResultRow] = {}
             for res in results_list:
+                if res.get('finish') is not None:
+                    finisher_count += 1
                 cid = res.get('competitor_id')
-                entrant = entrants_map.get(cid, {})
-                finish_str = entrant.get('finish_time')
-                is_non_finisher = res.get('finish') is None
-                elapsed_secs = res.get('elapsed_seconds')
-                results[cid] = {
-                    'finish_time': finish_str,
-                    'on_course_secs': elapsed_secs,
-                    'elapsed_time': (_format_hms(elapsed_secs) if (elapsed_secs and elapsed_secs > 0) else None),
-                    'abs_pos': res.get('absolute_position'),
-                    'allowance': res.get('allowance_seconds'),
-                    'adj_time_secs': res.get('adjusted_time_seconds'),
-                    'adj_time': (_format_hms(res.get('adjusted_time_seconds')) if not is_non_finisher else None),
-                    'hcp_pos': res.get('handicap_position'),
-                    'race_pts': res.get('traditional_points')
-                    if res.get('traditional_points') is not None
-                    else (finisher_count + 1 if is_non_finisher else None),
-                    'league_pts': res.get('points')
-                    if res.get('points') is not None
-                    else (0.0 if is_non_finisher else None),
-                    'full_delta': res.get('full_delta')
-                    if res.get('full_delta') is not None
-                    else (0 if is_non_finisher else None),
-                    'scaled_delta': res.get('scaled_delta')
-                    if res.get('scaled_delta') is not None
-                    else (0 if is_non_finisher else None),
-                    'actual_delta': res.get('actual_delta')
-                    if res.get('actual_delta') is not None
-                    else (0 if is_non_finisher else None),
-                    'revised_hcp': res.get('revised_handicap')
-                    if res.get('revised_handicap') is not None
-                    else (
-                        res.get('initial_handicap') if is_non_finisher else None
-                    ),
-                    'place': res.get('status'),
-                    'handicap_override': entrant.get('handicap_override'),
-                }
+                results[cid] = _result_row(res, entrants_map.get(cid, {}), finisher_count)
+            fleet_adjustment = int(round(_scaling_factor(finisher_count) * 100)) if finisher_count else 0
             # Keys are canonical integer ids; no normalization required
 
             _cache_set_race(race_id, results, fleet_adjustment)
 
             selected_race = race
-            skip_heavy = True
-
-        if not skip_heavy:
-            # Load all races from data.json and process them chronologically until target race
-            data = load_data()
-            race_objs: list[dict] = []
-            for season in data.get('seasons', []):
-                for s in season.get('series', []):
-                    for r in s.get('races', []):
-                        race_objs.append(r)
-            # Use global chronological order when available
-            order = _race_order_map()
-            if order:
-                race_objs.sort(key=lambda r: order.get(r.get('race_id'), 10**9))
-            else:
-                race_objs.sort(key=lambda r: (r.get('date'), r.get('start_time')))
-
-            pre_race_handicaps = handicap_map
-            results: dict[int, dict] = {}
-
-            for race in race_objs:
-                start_seconds = _parse_hms(race.get('start_time'))
-                entrants = race.get('competitors', [])
-                entrants_map: dict[int, dict] = {
-                    int(e.get('competitor_id')): e for e in entrants if e.get('competitor_id') is not None
-                }
-                snapshot = handicap_map.copy()
-            
-                if race.get('race_id') == race_id:
-                    # Build entries for the full fleet order, enriching with any
-                    # entrants. This guarantees all fleet members appear and
-                    # finishers line up with their result rows.
-                    calc_entries: list[dict] = []
-
-                    # Helper maps by sail number for fleets without competitor_id
-                    # Build ordered ids using fleet order (canonical integer ids)
-                    ordered_ids: list[int] = []
-                    for comp in fleet:
-                        cid = comp.get('competitor_id')
-                        if cid is not None:
-                            ordered_ids.append(int(cid))
-
-                    # Append any remaining entrants not represented in fleet
-                    for cid in entrants_map.keys():
-                        if cid not in ordered_ids:
-                            ordered_ids.append(cid)
-
-                    # Build calc entries
-                    fleet_map: dict[int, dict] = {int(c.get('competitor_id')): c for c in fleet if c.get('competitor_id') is not None}
-                    for cid in ordered_ids:
-                        ent = entrants_map.get(cid, {})
-                        # Find fleet record for this id if possible
-                        comp = fleet_map.get(cid)
-                        # initial handicap preference: per-race override -> snapshot ->
-                        # entrant initial -> fleet current/starting -> 0
-                        initial = snapshot.get(cid)
-                        if ent.get('handicap_override') is not None:
-                            try:
-                                initial = int(ent['handicap_override'])
-                                snapshot[cid] = initial
-                            except (ValueError, TypeError):
-                                pass
-                        if initial is None:
-                            initial = ent.get('initial_handicap')
-                        if initial is None and comp is not None:
-                            initial = (
-                                comp.get('starting_handicap_s_per_hr')
-                                or comp.get('current_handicap_s_per_hr')
-                                or 0
-                            )
-                        if initial is None:
-                            initial = 0
-
-                        entry = {
-                            'competitor_id': cid,
-                            'start': start_seconds or 0,
-                            'initial_handicap': int(initial),
-                        }
-                        ft = _parse_hms(ent.get('finish_time')) if ent else None
-                        if ft is not None:
-                            entry['finish'] = ft
-                        status = ent.get('status') if ent else None
-                        if status:
-                            entry['status'] = status
-                        calc_entries.append(entry)
-
-                    results_list = calculate_race_results(calc_entries)
-                    finisher_count = sum(
-                        1 for r in results_list if r.get('finish') is not None
-                    )
-                    if finisher_count:
-                        fleet_adjustment = int(
-                            round(_scaling_factor(finisher_count) * 100)
-                        )
-                    for res in results_list:
-                        cid = res.get('competitor_id')
-                        entrant = entrants_map.get(cid, {})
-                        finish_str = entrant.get('finish_time')
-                        is_non_finisher = res.get('finish') is None
-                        elapsed_secs = res.get('elapsed_seconds')
-                        results[cid] = {
-                            'finish_time': finish_str,
-                            'on_course_secs': elapsed_secs,
-                            'elapsed_time': (_format_hms(elapsed_secs) if (elapsed_secs and elapsed_secs > 0) else None),
-                            'abs_pos': res.get('absolute_position'),
-                            'allowance': res.get('allowance_seconds'),
-                            'adj_time_secs': res.get('adjusted_time_seconds'),
-                            'adj_time': (_format_hms(res.get('adjusted_time_seconds')) if not is_non_finisher else None),
-                            'hcp_pos': res.get('handicap_position'),
-                            'race_pts': res.get('traditional_points')
-                            if res.get('traditional_points') is not None
-                            else (finisher_count + 1 if is_non_finisher else None),
-                            'league_pts': res.get('points')
-                            if res.get('points') is not None
-                            else (0.0 if is_non_finisher else None),
-                            'full_delta': res.get('full_delta')
-                            if res.get('full_delta') is not None
-                            else (0 if is_non_finisher else None),
-                            'scaled_delta': res.get('scaled_delta')
-                            if res.get('scaled_delta') is not None
-                            else (0 if is_non_finisher else None),
-                            'actual_delta': res.get('actual_delta')
-                            if res.get('actual_delta') is not None
-                            else (0 if is_non_finisher else None),
-                            'revised_hcp': res.get('revised_handicap')
-                            if res.get('revised_handicap') is not None
-                            else (
-                                res.get('initial_handicap') if is_non_finisher else None
-                            ),
-                            'place': res.get('status'),
-                            'handicap_override': entrant.get('handicap_override'),
-                        }
-
-                    # Keys are canonical integer ids; no normalization required
-
-                    selected_race = race
-                    pre_race_handicaps = snapshot
-
-                    # Update map for completeness then stop processing
-                    for res in results_list:
-                        cid = res.get('competitor_id')
-                        revised = res.get('revised_handicap')
-                        if revised is not None:
-                            handicap_map[cid] = revised
-                    break
-
-            # Process prior races to update handicap map
-            calc_entries: list[dict] = []
-            for cid, entrant in entrants_map.items():
-                initial = snapshot.get(cid, 0)
-                if entrant.get('handicap_override') is not None:
-                    try:
-                        initial = int(entrant['handicap_override'])
-                        snapshot[cid] = initial
-                    except (ValueError, TypeError):
-                        pass
-                entry = {
-                    'competitor_id': cid,
-                    'start': start_seconds or 0,
-                    'initial_handicap': initial,
-                }
-                ft = _parse_hms(entrant.get('finish_time'))
-                if ft is not None:
-                    entry['finish'] = ft
-                status = entrant.get('status')
-                if status:
-                    entry['status'] = status
-                calc_entries.append(entry)
-
-            prior_results = calculate_race_results(calc_entries)
-            for res in prior_results:
-                cid = res.get('competitor_id')
-                revised = res.get('revised_handicap')
-                if revised is not None:
-                    handicap_map[cid] = revised
 
         # Build a display list for the race table that includes the entire
         # fleet, plus any entrants not present in the fleet register. This
@@ -1889,12 +2107,7 @@ def series_detail(series_id):
         # all boats even without a recorded finish time.
         display_list: list[dict] = []
         if selected_race:
-            # Build map of this race's entrants
-            local_entrants_map = {
-                e.get('competitor_id'): e
-                for e in (selected_race.get('competitors', []) or [])
-                if e.get('competitor_id')
-            }
+            local_entrants_map = entrants_map
 
             seen: set[int] = set()
 
@@ -1961,10 +2174,7 @@ def series_detail(series_id):
     # of all races for navigation. Otherwise show the standard breadcrumb trail.
     if selected_race:
         breadcrumbs = None
-        all_races = _load_all_races()
-        order = _race_order_map()
-        if order:
-            all_races.sort(key=lambda r: order.get(r.get('race_id'), 10**9))
+        all_races = _sorted_all_races()
     else:
         breadcrumbs = [('Races', url_for('main.races')), (series.get('name', series_id), None)]
         all_races = []
@@ -1985,10 +2195,11 @@ def series_detail(series_id):
         'fleet_size_factor': scoring_settings.get('fleet_size_factor', []) or [],
     }
     # Embed pre-race snapshot seeds for the selected race, if any
-    try:
-        pre_race_seeds_full = build_pre_race_snapshot(selected_race.get('race_id')) if selected_race else {}
-    except Exception:
-        pre_race_seeds_full = {}
+    if pre_race_seeds_full is None:
+        try:
+            pre_race_seeds_full = build_pre_race_snapshot(selected_race.get('race_id')) if selected_race else {}
+        except Exception:
+            pre_race_seeds_full = {}
     # Filter seeds to race entrants only (exclude entire fleet)
     entrant_ids = set()
     try:
@@ -2020,32 +2231,24 @@ def series_detail(series_id):
 
 @bp.route('/races/<race_id>')
 def race_sheet(race_id):
-    race = _find_race(race_id)
-    if race is None:
+    # Only the owning series is needed for the redirect; the races.series_id
+    # FK is already canonical so skip loading entrants and sibling races.
+    canonical_id = ds_find_race_series_id(race_id)
+    if not canonical_id:
         abort(404)
-    series_id = race.get('series_id')
-    if not series_id:
-        abort(404)
-    series, _ = _find_series(series_id)
-    if not series:
-        abort(404)
-    canonical_id = series.get('series_id')
     return redirect(url_for('main.series_detail', series_id=canonical_id, race_id=race_id))
 
 
 #<getdata>
 @bp.route('/standings')
+@_cache_response
 def standings():
     scoring = request.args.get('format', 'league').lower()
     season_param = request.args.get('season')
-    # Avoid full-tree load: get just the season years
-    seasons_meta = ds_list_seasons()
-    seasons = sorted({int(s.get('year')) for s in (seasons_meta or []) if s.get('year') is not None}, reverse=True)
-    if not seasons:
-        season_val = None
-        table = []
-        race_groups = []
-    else:
+    # Avoid full-tree load: get just the (cached) season years
+    seasons = ds_list_season_years()
+    season_val = None
+    if seasons:
         try:
             season_int = int(season_param) if season_param is not None else None
         except ValueError:
@@ -2054,12 +2257,17 @@ def standings():
             season_val = seasons[0]
         else:
             season_val = season_int
+    gen = ds_generation()
+    if season_val is None:
+        table = []
+        race_groups = []
+    else:
         cached = _cache_get_standings(season_val, scoring)
         if cached is not None:
             table, race_groups = cached
         else:
             table, race_groups = _season_standings(season_val, scoring)
-            _cache_set_standings(season_val, scoring, table, race_groups)
+            _cache_set_standings(season_val, scoring, table, race_groups, generation=gen)
     breadcrumbs = [('Standings', None)]
     return render_template(
         'standings.html',
@@ -2087,9 +2295,7 @@ def fleet():
 @bp.route('/api/fleet', methods=['POST'])
 def update_fleet():
     """Persist fleet edits (add, edit, delete) and trigger handicap refresh."""
-    payload = request.get_json(silent=True)
-    if payload is None:
-        return {'error': 'Request body must be valid JSON.'}, 400
+    payload = _request_json()
 
     competitors_raw = payload.get('competitors')
     if competitors_raw is None:
@@ -2113,6 +2319,8 @@ def update_fleet():
     normalized: list[dict] = []
     incoming_ids: set[int] = set()
     updated_ids: set[int] = set()
+    # Set when a handicap, rather than only a name or sail number, changes
+    handicap_dirty = False
     seen_sail_numbers: set[str] = set()
 
     def _coerce_seconds(value, *, field: str, label: str) -> int:
@@ -2180,16 +2388,21 @@ def update_fleet():
                     existing_curr = int(existing_entry.get('current_handicap_s_per_hr') or existing_start)
                 except Exception:
                     existing_curr = existing_start
-                if (
+                if existing_start != starting or existing_curr != current:
+                    updated_ids.add(cid)
+                    handicap_dirty = True
+                elif (
                     _norm_str(existing_entry.get('sailor_name')) != sailor
                     or _norm_str(existing_entry.get('boat_name')) != boat
                     or _norm_str(existing_entry.get('sail_no')) != sail_no
-                    or existing_start != starting
-                    or existing_curr != current
                 ):
                     updated_ids.add(cid)
             else:
                 updated_ids.add(cid)
+                handicap_dirty = True
+        elif item.get('starting_handicap_s_per_hr') not in (None, ''):
+            # A new boat's seed feeds any race that already lists it
+            handicap_dirty = True
 
         # Enforce unique sail numbers (case-insensitive, non-empty)
         if sail_no:
@@ -2245,9 +2458,11 @@ def update_fleet():
             message = detail
         return {'error': message}, 500
 
-    # Fleet changes affect baseline handicaps for all races
-    recalculate_handicaps()
+    # Fleet changes affect names on every page; only handicap edits and
+    # removals change the baseline handicaps for all races
     _cache_clear_all()
+    if handicap_dirty or removed_ids:
+        _schedule_full_recalc()
 
     # Provide summary in response (use persisted data when available)
     response = {
@@ -2287,7 +2502,7 @@ def settings():
 @bp.route('/api/settings', methods=['POST'])
 def save_settings():
     """Persist updated settings to the JSON configuration file."""
-    payload = request.get_json() or {}
+    payload = _request_json()
     # Preserve versioning information and update timestamp
     existing = ds_get_settings() or {"version": 0}
 
@@ -2297,8 +2512,8 @@ def save_settings():
     # Persist only settings via datastore helper
     ds_set_settings(payload)
 
-    # Reload scoring settings so future calculations use the new values
-    importlib.reload(scoring_module)
+    # Swap in the new scoring tables so future calculations use the new values
+    scoring_module.load_settings(payload)
 
     # Bust caches after settings change
     _cache_clear_all()
@@ -2355,7 +2570,7 @@ def race_snapshot_version(race_id: str):
 
     # Derive entrant ids from the race object
     try:
-        _season, _series, race_obj = ds_find_race(race_id)
+        _season, _series, race_obj = ds_find_race_indexed(race_id)
         entrant_ids = [
             int(e.get('competitor_id'))
             for e in (race_obj.get('competitors', []) if race_obj else [])
@@ -2421,7 +2636,7 @@ def race_snapshot_version(race_id: str):
 #<getdata>
 @bp.route('/api/races/<race_id>', methods=['POST'])
 def update_race(race_id):
-    data = request.get_json() or {}
+    data = _request_json()
     series_choice = data.get('series_id')
     new_series_name = data.get('new_series_name')
     race_date = data.get('date')
@@ -2439,17 +2654,8 @@ def update_race(race_id):
         except Exception:
             abort(400, description=f"Invalid start time '{start_time}'. Expected HH:MM:SS.")
 
-    # Validate finish time formats in payload
-    for ft in (finish_times or []):
-        val = (ft or {}).get('finish_time')
-        if isinstance(val, str) and val.strip():
-            try:
-                _ = _parse_hms(val)
-            except Exception:
-                who = (ft or {}).get('competitor_id') or 'unknown competitor'
-                abort(400, description=f"Invalid finish time '{val}' for {who}. Expected HH:MM:SS.")
-
-    store = load_data()
+    if not isinstance(finish_times or [], list) or not isinstance(handicap_overrides or [], list):
+        abort(400, description="finish_times and handicap_overrides must be lists.")
 
     # Validate incoming payload competitor IDs as integers existing in fleet
     fleet = ds_get_fleet().get('competitors', [])
@@ -2464,15 +2670,42 @@ def update_race(race_id):
             abort(400, description=f"Unknown competitor id: {cid}. Add to Fleet first.")
         return cid
 
-    # Normalize finish_times and overrides to use integer ids
-    finish_times = [
-        {'competitor_id': _parse_cid(ft.get('competitor_id')), 'finish_time': ft.get('finish_time')}
-        for ft in (finish_times or [])
-    ]
-    handicap_overrides = [
-        {'competitor_id': _parse_cid(o.get('competitor_id')), 'handicap': o.get('handicap')}
-        for o in (handicap_overrides or [])
-    ]
+    # Validate and normalize finish_times and overrides in one pass, before
+    # the data tree is loaded: check time formats, use integer ids and count
+    # the submitted finishers on the way
+    normalized_finish_times: list[dict] = []
+    submitted_finishers = 0
+    for ft in (finish_times or []):
+        if not isinstance(ft, dict):
+            abort(400, description="Each finish_times entry must be an object.")
+        finish = ft.get('finish_time')
+        if isinstance(finish, str) and finish.strip():
+            try:
+                _parse_hms(finish)
+            except Exception:
+                who = ft.get('competitor_id') or 'unknown competitor'
+                abort(400, description=f"Invalid finish time '{finish}' for {who}. Expected HH:MM:SS.")
+        if finish:
+            submitted_finishers += 1
+        normalized_finish_times.append({'competitor_id': _parse_cid(ft.get('competitor_id')), 'finish_time': finish})
+    finish_times = normalized_finish_times
+    normalized_overrides: list[dict] = []
+    for o in (handicap_overrides or []):
+        if not isinstance(o, dict):
+            abort(400, description="Each handicap_overrides entry must be an object.")
+        normalized_overrides.append({'competitor_id': _parse_cid(o.get('competitor_id')), 'handicap': o.get('handicap')})
+    handicap_overrides = normalized_overrides
+
+    store = load_data()
+
+    def _set_override(ent: dict, val) -> None:
+        if val in (None, ''):
+            ent.pop('handicap_override', None)
+        else:
+            try:
+                ent['handicap_override'] = int(val)
+            except (ValueError, TypeError):
+                ent.pop('handicap_override', None)
 
     def _apply_overrides(entrants_list: list[dict]):
         if not handicap_overrides:
@@ -2481,14 +2714,7 @@ def update_race(race_id):
         for ent in entrants_list:
             cid = ent.get('competitor_id')
             if cid in ov_map:
-                val = ov_map[cid]
-                if val in (None, ''):
-                    ent.pop('handicap_override', None)
-                else:
-                    try:
-                        ent['handicap_override'] = int(val)
-                    except (ValueError, TypeError):
-                        ent.pop('handicap_override', None)
+                _set_override(ent, ov_map[cid])
         return entrants_list
 
     if race_id == '__new__':
@@ -2497,7 +2723,7 @@ def update_race(race_id):
         start_time = start_time or ''
         timestamp = _utc_now_isoformat()
         try:
-            season_year = int(datetime.strptime(race_date, '%Y-%m-%d').year)
+            season_year = _parse_iso_date(race_date).year
         except ValueError:
             abort(400)
         if series_choice == '__new__':
@@ -2509,12 +2735,9 @@ def update_race(race_id):
             if not series_obj:
                 abort(400)
         series_id_val = series_obj.get('series_id')
-        # Build competitors from validated integer finish_times
-        competitors: list[dict] = []
-        for ft in finish_times:
-            ent = {'competitor_id': ft['competitor_id'], 'finish_time': ft.get('finish_time')}
-            competitors.append(ent)
-        competitors = _apply_overrides(competitors)
+        # The normalized finish_times are already fresh entrant dicts; use them as-is
+        competitors: list[dict] = _apply_overrides(finish_times)
+        finisher_count = submitted_finishers
         # competitor_ids are already canonical integers
         # Append new race, then renumber to assign id and sequence
         series_obj.setdefault('races', []).append({
@@ -2535,26 +2758,6 @@ def update_race(race_id):
         new_race = series_obj['races'][-1]
         new_race_id = new_race.get('race_id')
         # Persist with minimal entrants writes: include 'competitors' only for the new race
-        def _prune_seasons_for_save(seasons: list[dict], keep_ids: set[str]) -> list[dict]:
-            out: list[dict] = []
-            for season in (seasons or []):
-                s_copy = dict(season)
-                series_list = []
-                for series in (season.get('series') or []):
-                    se_copy = dict(series)
-                    races_out = []
-                    for race in (series.get('races') or []):
-                        r_copy = dict(race)
-                        rid = r_copy.get('race_id')
-                        if rid not in keep_ids and 'competitors' in r_copy:
-                            r_copy.pop('competitors', None)
-                        races_out.append(r_copy)
-                    se_copy['races'] = races_out
-                    series_list.append(se_copy)
-                s_copy['series'] = series_list
-                out.append(s_copy)
-            return out
-
         # Include entrants for all races whose ids changed due to renumber
         changed_new_ids = {str(v) for (k, v) in (mapping or {}).items() if v and v != k}
         keep_ids = changed_new_ids or {str(new_race_id)}
@@ -2587,8 +2790,7 @@ def update_race(race_id):
             _cache_delete_standings_for_season(season_year)
         except Exception:
             pass
-        _schedule_forward_recalc(new_race_id)
-        finisher_count = sum(1 for ft in finish_times if ft.get('finish_time'))
+        _schedule_forward_recalc(new_race_id, season_year=season_year)
         redirect_url = url_for('main.series_detail', series_id=series_id_val, race_id=new_race_id)
         return {'finisher_count': finisher_count, 'redirect': redirect_url}
 
@@ -2609,7 +2811,7 @@ def update_race(race_id):
             if not date_str:
                 abort(400)
             try:
-                season_year = int(datetime.strptime(date_str, '%Y-%m-%d').year)
+                season_year = _parse_iso_date(date_str).year
             except ValueError:
                 abort(400)
             store, _season_new, target_series = ds_ensure_series(season_year, new_series_name, data=store)
@@ -2621,10 +2823,14 @@ def update_race(race_id):
 
         if target_series.get('series_id') != current_series_id:
             # Move race to target series
-            series_obj['races'].remove(race_obj)
+            _detach_race(series_obj, race_obj)
             race_obj['series_id'] = target_series.get('series_id')
             target_series.setdefault('races', []).append(race_obj)
 
+    # Only timing and entrant edits move handicaps; moving the race to another
+    # series or renaming leaves the chronological chain unchanged
+    prev_timing = (race_obj.get('date'), race_obj.get('start_time'))
+
     # Apply field edits
     if race_date is not None:
         race_obj['date'] = race_date
@@ -2637,13 +2843,16 @@ def update_race(race_id):
             race_obj['start_time'] = start_time
         else:
             race_obj['start_time'] = '00:00:00'
+    handicap_dirty = bool(finish_times or handicap_overrides) or (
+        (race_obj.get('date'), race_obj.get('start_time')) != prev_timing
+    )
+    # Counted while pruning entrants below; None means entrants were untouched
+    finisher_count: int | None = None
     if finish_times or handicap_overrides:
         ft_map = {ft['competitor_id']: ft.get('finish_time') for ft in (finish_times or [])}
         ov_map = {o['competitor_id']: o.get('handicap') for o in (handicap_overrides or [])}
 
         entrants_list = race_obj.setdefault('competitors', [])
-        existing = {int(e.get('competitor_id')): e for e in entrants_list if e.get('competitor_id') is not None}
-        pre_existing_ids = set(existing.keys())
 
         # Build a pre-race snapshot based on current (unsaved) edits to date/start_time
         try:
@@ -2668,10 +2877,28 @@ def update_race(race_id):
                     return 0
             return None
 
-        # Update existing entrants with new finish times
-        for cid, entrant in list(existing.items()):
+        # One pass over the current entrants: index them, apply new finish
+        # times and overrides, and when an override was explicitly cleared in
+        # this request reset initial_handicap to the snapshot seed so the
+        # start race is correct.
+        existing: dict[int, dict] = {}
+        for entrant in entrants_list:
+            if entrant.get('competitor_id') is None:
+                continue
+            cid = int(entrant.get('competitor_id'))
+            existing[cid] = entrant
             if cid in ft_map:
                 entrant['finish_time'] = ft_map[cid]
+            if cid in ov_map:
+                handicap = ov_map[cid]
+                _set_override(entrant, handicap)
+                if handicap in (None, ''):
+                    seed = _baseline_for_cid(cid)
+                    if seed is not None:
+                        try:
+                            entrant['initial_handicap'] = int(seed)
+                        except Exception:
+                            pass
 
         # Add new entrants that now have a finish time or an override
         for cid, finish in ft_map.items():
@@ -2683,6 +2910,8 @@ def update_race(race_id):
                     abort(400, description=f"No starting handicap available from the Fleet for competitor {cid}. Add a starting handicap or provide a race override.")
                 if base is not None:
                     ent['initial_handicap'] = int(base)
+                if cid in ov_map:
+                    _set_override(ent, ov_map[cid])
                 entrants_list.append(ent)
                 existing[cid] = ent
 
@@ -2698,48 +2927,31 @@ def update_race(race_id):
                 except Exception:
                     if base is not None:
                         ent['initial_handicap'] = int(base)
+                _set_override(ent, handicap)
                 entrants_list.append(ent)
                 existing[cid] = ent
 
-        # Apply overrides across the (possibly expanded) entrant list
-        _apply_overrides(entrants_list)
-
-        # If an override was explicitly cleared in this request, reset initial_handicap
-        # for those entrants to the snapshot seed so the start race is correct.
-        for cid, handicap in ov_map.items():
-            if handicap in (None, '') and cid in existing:
-                seed = _baseline_for_cid(cid)
-                if seed is not None:
-                    try:
-                        existing[cid]['initial_handicap'] = int(seed)
-                    except Exception:
-                        pass
-
-        # Ensure competitor ids are integers in entrants_list
-        normalized_existing: list[dict] = []
+        # Ensure competitor ids are integers, then prune entrants that have
+        # no finish, no override, and no explicit status
+        pruned: list[dict] = []
+        finisher_count = 0
         for ent in entrants_list:
             try:
-                ent['competitor_id'] = int(ent.get('competitor_id'))
-                normalized_existing.append(ent)
+                cid_int = int(ent.get('competitor_id'))
             except Exception:
                 # Skip invalid entries
                 continue
-        # Prune entrants that have no finish, no override, and no explicit status
-        pruned: list[dict] = []
-        for ent in normalized_existing:
+            ent['competitor_id'] = cid_int
             ft = ent.get('finish_time')
             has_finish = isinstance(ft, str) and ft.strip() != ''
             has_override = ent.get('handicap_override') not in (None, '')
             has_status = bool(ent.get('status'))
             # Keep if this save explicitly clears an override for a previously present entrant
-            override_cleared = False
-            try:
-                cid_int = int(ent.get('competitor_id'))
-                override_cleared = (cid_int in ov_map and ov_map.get(cid_int) in (None, ''))
-            except Exception:
-                override_cleared = False
+            override_cleared = cid_int in ov_map and ov_map.get(cid_int) in (None, '')
             if has_finish or has_override or has_status or override_cleared:
                 pruned.append(ent)
+                if ft:
+                    finisher_count += 1
         race_obj['competitors'] = pruned
 
     race_obj['updated_at'] = _utc_now_isoformat()
@@ -2773,38 +2985,23 @@ def update_race(race_id):
         except Exception:
             pass
         redirect_series_id = target_series.get('series_id')
+        season_current_year = _season_year_of(target_series)
         try:
-            season_current, _series_current, _race_current = ds_find_race(final_race_id)
+            if season_current_year is None:
+                season_current, _series_current, _race_current = ds_find_race(final_race_id)
+                season_current_year = (season_current or {}).get('year') if season_current else None
             _cache_delete_race(final_race_id)
-            _cache_delete_standings_for_season((season_current or {}).get('year') if season_current else None)
+            _cache_delete_standings_for_season(season_current_year)
         except Exception:
             pass
-        _schedule_forward_recalc(final_race_id)
+        if handicap_dirty:
+            _schedule_forward_recalc(final_race_id, season_year=season_current_year)
         redirect_url = url_for('main.series_detail', series_id=redirect_series_id, race_id=final_race_id)
-        finisher_count = sum(1 for e in race_obj.get('competitors', []) if e.get('finish_time'))
+        if finisher_count is None:
+            finisher_count = sum(1 for e in race_obj.get('competitors', []) if e.get('finish_time'))
         return {'finisher_count': finisher_count, 'redirect': redirect_url}
 
     # Persist fast with minimal entrants writes: include 'competitors' only for edited race
-    def _prune_seasons_for_save(seasons: list[dict], keep_ids: set[str]) -> list[dict]:
-        out: list[dict] = []
-        for season in (seasons or []):
-            s_copy = dict(season)
-            series_list = []
-            for series in (season.get('series') or []):
-                se_copy = dict(series)
-                races_out = []
-                for race in (series.get('races') or []):
-                    r_copy = dict(race)
-                    rid = r_copy.get('race_id')
-                    if rid not in keep_ids and 'competitors' in r_copy:
-                        r_copy.pop('competitors', None)
-                    races_out.append(r_copy)
-                se_copy['races'] = races_out
-                series_list.append(se_copy)
-            s_copy['series'] = series_list
-            out.append(s_copy)
-        return out
-
     # Include entrants for all races whose ids changed due to renumber (target and source series)
     changed_new_ids_t = {str(v) for (k, v) in (mapping_target or {}).items() if v and v != k}
     changed_new_ids_s = {str(v) for (k, v) in (mapping_source or {}).items() if v and v != k}
@@ -2834,19 +3031,24 @@ def update_race(race_id):
     save_data({'seasons': pruned})
     redirect_series_id = target_series.get('series_id')
 
-    # Targeted cache invalidation for current race and its season
+    # Targeted cache invalidation for current race and its season; the target
+    # series already carries the season year so avoid re-fetching the race
+    season_current_year = _season_year_of(target_series)
     try:
-        # Resolve season year for standings invalidation
-        season_current, _series_current, _race_current = ds_find_race(final_race_id)
+        if season_current_year is None:
+            season_current, _series_current, _race_current = ds_find_race(final_race_id)
+            season_current_year = (season_current or {}).get('year') if season_current else None
         _cache_delete_race(final_race_id)
-        _cache_delete_standings_for_season((season_current or {}).get('year') if season_current else None)
+        _cache_delete_standings_for_season(season_current_year)
     except Exception:
         pass
 
     # Kick off forward-only recalculation asynchronously
-    _schedule_forward_recalc(final_race_id)
+    if handicap_dirty:
+        _schedule_forward_recalc(final_race_id, season_year=season_current_year)
     redirect_url = url_for('main.series_detail', series_id=redirect_series_id, race_id=final_race_id)
-    finisher_count = sum(1 for e in race_obj.get('competitors', []) if e.get('finish_time'))
+    if finisher_count is None:
+        finisher_count = sum(1 for e in race_obj.get('competitors', []) if e.get('finish_time'))
     return {'finisher_count': finisher_count, 'redirect': redirect_url}
 #</getdata>
 
@@ -2866,7 +3068,7 @@ def preview_race(race_id):
       - finisher_count
       - fleet_adjustment (percentage integer)
     """
-    data = request.get_json() or {}
+    data = _request_json()
     # Distinguish between omitted vs. explicit clear for start_time
     has_start_time_field = 'start_time' in data
     start_time_override = data.get('start_time')
@@ -2891,7 +3093,7 @@ def preview_race(race_id):
                 abort(400, description=f"Invalid finish time '{val}' for {who}. Expected HH:MM:SS.")
 
     # Load race and fleet baselines
-    _season_obj, _series_obj, race_obj = ds_find_race(race_id)
+    _season_obj, _series_obj, race_obj = ds_find_race_indexed(race_id)
     if not race_obj:
         abort(404)
     fleet = ds_get_fleet().get('competitors', [])
@@ -3018,46 +3220,17 @@ def preview_race(race_id):
 
     # Compute results for this race only
     results_list = calculate_race_results(calc_entries)
-    finisher_count = sum(1 for r in results_list if r.get('finish') is not None)
-    fleet_adjustment = int(round(_scaling_factor(finisher_count) * 100)) if finisher_count else 0
 
-    # Helper to format seconds as HH:MM:SS
-    def _format_hms(seconds: float | None) -> str | None:
-        if seconds is None:
-            return None
-        total = int(round(seconds))
-        h = total // 3600
-        m = (total % 3600) // 60
-        s = total % 60
-        return f"{h:02d}:{m:02d}:{s:02d}"
-
-    # Build response keyed by competitor id
-    results: dict[int, dict] = {}
+    # Build response keyed by competitor id; finishers come first, so the
+    # running count is final before any non-finisher row uses it.
+    finisher_count = 0
+    results: dict[int, RaceResultRow] = {}
     for res in results_list:
+        if res.get('finish') is not None:
+            finisher_count += 1
         cid = res.get('competitor_id')
-        ent = entrants_map.get(int(cid), {})
-        is_non_finisher = res.get('finish') is None
-        elapsed_secs = res.get('elapsed_seconds')
-        results[int(cid)] = {
-            'finish_time': ent.get('finish_time') if ent is not None else None,
-            'on_course_secs': elapsed_secs,
-            'elapsed_time': (_format_hms(elapsed_secs) if (elapsed_secs and elapsed_secs > 0) else None),
-            'abs_pos': res.get('absolute_position'),
-            'allowance': res.get('allowance_seconds'),
-            'adj_time_secs': res.get('adjusted_time_seconds'),
-            'adj_time': (_format_hms(res.get('adjusted_time_seconds')) if not is_non_finisher else None),
-            'hcp_pos': res.get('handicap_position'),
-            'race_pts': res.get('traditional_points')
-            if res.get('traditional_points') is not None
-            else (finisher_count + 1 if is_non_finisher else None),
-            'league_pts': res.get('points') if res.get('points') is not None else (0.0 if is_non_finisher else None),
-            'full_delta': res.get('full_delta') if res.get('full_delta') is not None else (0 if is_non_finisher else None),
-            'scaled_delta': res.get('scaled_delta') if res.get('scaled_delta') is not None else (0 if is_non_finisher else None),
-            'actual_delta': res.get('actual_delta') if res.get('actual_delta') is not None else (0 if is_non_finisher else None),
-            'revised_hcp': res.get('revised_handicap') if res.get('revised_handicap') is not None else (res.get('initial_handicap') if is_non_finisher else None),
-            'place': res.get('status'),
-            'handicap_override': ent.get('handicap_override'),
-        }
+        results[int(cid)] = _result_row(res, entrants_map.get(int(cid), {}), finisher_count)
+    fleet_adjustment = int(round(_scaling_factor(finisher_count) * 100)) if finisher_count else 0
 
     return {
         'results': results,
@@ -3073,10 +3246,12 @@ def delete_race(race_id):
     if not race_obj or not series_obj:
         abort(404)
     series_id = series_obj.get('series_id')
-    series_obj['races'].remove(race_obj)
-    ds_renumber_races(series_obj)
-    # Persist only races/series/seasons for deletion
-    save_data({'seasons': store.get('seasons', [])})
+    _detach_race(series_obj, race_obj)
+    mapping = ds_renumber_races(series_obj)
+    # Persist only races/series/seasons for deletion; entrants are rewritten
+    # only for the races whose ids shifted when the series was renumbered
+    keep_ids = {str(v) for (k, v) in (mapping or {}).items() if v and v != k}
+    save_data({'seasons': _prune_seasons_for_save(store.get('seasons', []), keep_ids)})
     redirect_url = url_for('main.series_detail', series_id=series_id)
     # Bust caches after race deletion
     _cache_clear_all()
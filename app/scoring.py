@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
+from operator import itemgetter
 from typing import Dict, Iterable, List, Tuple
 
 SECONDS_PER_HOUR = 3600
+_NON_FINISHING_STATUSES = frozenset({"DNF", "DNS", "DSQ"})
+# C-level sort keys for the two finisher rankings
+_ELAPSED_KEY = itemgetter("elapsed_seconds")
+_ADJUSTED_KEY = itemgetter("adjusted_time_seconds")
 
 from .datastore import get_settings
 
@@ -25,22 +28,31 @@ def _build_lookup(entries: List[Dict], key_field: str, value_field: str) -> Tupl
     return lookup, default
 
 
-# Load configuration and tolerate missing settings with safe defaults
-# Load configuration and tolerate missing DB/settings with safe defaults
-try:
-    _SETTINGS = get_settings() or {}
-except Exception:
-    _SETTINGS = {}
+def load_settings(settings: Dict | None = None) -> None:
+    """Rebuild the scoring lookup tables from ``settings``.
 
-_HANDICAP_DELTAS, _HANDICAP_DEFAULT = _build_lookup(
-    _SETTINGS.get("handicap_delta_by_rank", []), "rank", "delta_s_per_hr"
-)
-_LEAGUE_POINTS, _POINTS_DEFAULT = _build_lookup(
-    _SETTINGS.get("league_points_by_rank", []), "rank", "points"
-)
-_FLEET_FACTORS, _FLEET_DEFAULT = _build_lookup(
-    _SETTINGS.get("fleet_size_factor", []), "finishers", "factor"
-)
+    Without ``settings`` they are read from the datastore, tolerating a
+    missing DB/settings with safe defaults. Only the module-level tables are
+    replaced, so a settings save takes effect without re-importing the module.
+    """
+    global _SETTINGS, _HANDICAP_DELTAS, _HANDICAP_DEFAULT
+    global _LEAGUE_POINTS, _POINTS_DEFAULT, _FLEET_FACTORS, _FLEET_DEFAULT
+    if settings is None:
+        try:
+            settings = get_settings() or {}
+        except Exception:
+            settings = {}
+    deltas = _build_lookup(settings.get("handicap_delta_by_rank", []), "rank", "delta_s_per_hr")
+    points = _build_lookup(settings.get("league_points_by_rank", []), "rank", "points")
+    factors = _build_lookup(settings.get("fleet_size_factor", []), "finishers", "factor")
+    _SETTINGS = settings
+    _HANDICAP_DELTAS, _HANDICAP_DEFAULT = deltas
+    _LEAGUE_POINTS, _POINTS_DEFAULT = points
+    _FLEET_FACTORS, _FLEET_DEFAULT = factors
+
+
+# Load configuration at import time
+load_settings()
 
 
 def _full_delta(position: int) -> int:
@@ -100,25 +112,31 @@ def calculate_race_results(entries: Iterable[Dict]) -> List[Dict]:
         finish = entry.get("finish")
         if race_start is None:
             race_start = entry.get("start")
-        if status in {"DNF", "DNS", "DSQ"} or finish is None:
+        result = dict(entry)
+        if status in _NON_FINISHING_STATUSES or finish is None:
             # Record the entry with zeroed timing values so downstream
             # consumers can display consistent fields for all boats even when
             # they do not finish.
-            times = {
-                "elapsed_seconds": 0,
-                "allowance_seconds": 0.0,
-                "adjusted_time_seconds": 0.0,
-            }
-            non_finishers.append({**entry, **times, "status": status, "finish": None})
+            result["elapsed_seconds"] = 0
+            result["allowance_seconds"] = 0.0
+            result["adjusted_time_seconds"] = 0.0
+            result["status"] = status
+            result["finish"] = None
+            non_finishers.append(result)
             continue
 
-        times = adjusted_time(entry["start"], finish, entry["initial_handicap"])
-        result = {**entry, **times, "status": status}
+        # Same arithmetic as adjusted_time(), inlined to avoid a dict per entry
+        elapsed_seconds = finish - entry["start"]
+        allowance_seconds = entry["initial_handicap"] * (elapsed_seconds / SECONDS_PER_HOUR)
+        result["elapsed_seconds"] = elapsed_seconds
+        result["allowance_seconds"] = allowance_seconds
+        result["adjusted_time_seconds"] = elapsed_seconds - allowance_seconds
+        result["status"] = status
         finishers.append(result)
 
     # Rank by adjusted time (lower is better)
     # Determine absolute finishing positions based on raw elapsed time
-    finishers.sort(key=lambda r: r["elapsed_seconds"])
+    finishers.sort(key=_ELAPSED_KEY)
     last_elapsed = None
     abs_position = 0
     for idx, result in enumerate(finishers, start=1):
@@ -128,7 +146,7 @@ def calculate_race_results(entries: Iterable[Dict]) -> List[Dict]:
         result["absolute_position"] = abs_position
 
     # Rank by adjusted time (lower is better) for handicap results
-    finishers.sort(key=lambda r: r["adjusted_time_seconds"])
+    finishers.sort(key=_ADJUSTED_KEY)
 
     fleet_size = len(finishers)
     factor = _scaling_factor(fleet_size)
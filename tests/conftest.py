@@ -201,19 +201,10 @@ def patch_datastore(monkeypatch, memory_store):
     monkeypatch.setattr(pg, "set_fleet", set_fleet)
     monkeypatch.setattr(pg, "get_settings", get_settings)
     monkeypatch.setattr(pg, "set_settings", set_settings)
-    # Patch scoring constants and helper functions in-place
+    # Nothing read from a previous test's store may be served from cache
+    import app.datastore as _ds
+    _ds.invalidate()
+    # Point the scoring tables at the in-memory settings
     import app.scoring as _scoring
-    settings = memory_store["settings"]
-    hd, hd_def = _scoring._build_lookup(settings.get("handicap_delta_by_rank", []), "rank", "delta_s_per_hr")
-    lp, lp_def = _scoring._build_lookup(settings.get("league_points_by_rank", []), "rank", "points")
-    ff, ff_def = _scoring._build_lookup(settings.get("fleet_size_factor", []), "finishers", "factor")
-    _scoring._HANDICAP_DELTAS = hd
-    _scoring._HANDICAP_DEFAULT = hd_def
-    _scoring._LEAGUE_POINTS = lp
-    _scoring._POINTS_DEFAULT = lp_def
-    _scoring._FLEET_FACTORS = ff
-    _scoring._FLEET_DEFAULT = ff_def
-    _scoring._full_delta = lambda position: int(hd.get(position, hd_def))  # type: ignore
-    _scoring._scaling_factor = lambda size: float(ff.get(size, ff_def))  # type: ignore
-    _scoring._base_points = lambda position: float(lp.get(position, lp_def))  # type: ignore
+    _scoring.load_settings(memory_store["settings"])
     yield
@@ -177,3 +177,88 @@ def test_handicap_override(memory_store):
     r3_map = {e["competitor_id"]: e for e in r3["competitors"]}
     for cid, hcp in after_r2.items():
         assert r3_map[cid]["initial_handicap"] == hcp
+
+
+@pytest.mark.usefixtures("patch_datastore")
+def test_recalculate_handicaps_streams_on_postgres(memory_store, monkeypatch):
+    import copy
+
+    memory_store["fleet"] = {"competitors": [
+        {"competitor_id": i, "sail_no": str(i), "sailor_name": f"S{i}", "boat_name": "", "starting_handicap_s_per_hr": 100, "current_handicap_s_per_hr": 100}
+        for i in range(1, 3)
+    ]}
+    races = [
+        {"race_id": "R1", "date": "2025-01-01", "start_time": "00:00:00", "competitors": [
+            {"competitor_id": 1, "finish_time": "00:30:00", "initial_handicap": 100},
+            {"competitor_id": 2, "finish_time": "00:31:00", "initial_handicap": 100},
+        ]},
+        {"race_id": "R2", "date": "2025-01-08", "start_time": "00:00:00", "competitors": [
+            {"competitor_id": 1, "finish_time": "00:30:00", "handicap_override": 250},
+            {"competitor_id": 2, "finish_time": "00:31:00"},
+        ]},
+    ]
+    memory_store["seasons"] = [{"year": 2025, "series": [
+        {"series_id": "S", "name": "S", "season": 2025, "races": copy.deepcopy(races)}
+    ]}]
+
+    # Reference: the in-memory path rewrites the tree
+    routes.recalculate_handicaps()
+    stored = memory_store["seasons"][0]["series"][0]["races"]
+    expected_rows = [(r["race_id"], e["competitor_id"], e["initial_handicap"]) for r in stored for e in r["competitors"]]
+    expected_fleet = {c["competitor_id"]: c["current_handicap_s_per_hr"] for c in memory_store["fleet"]["competitors"]}
+
+    applied = []
+    monkeypatch.setattr(routes._pg, "iter_races_chronological", lambda: iter(copy.deepcopy(races)))
+    monkeypatch.setattr(
+        routes._pg,
+        "apply_recalculated_handicaps",
+        lambda pre, fleet: applied.append((pre, fleet)) or {"race_rows_updated": 1, "competitors_updated": 0},
+    )
+    monkeypatch.setattr(routes, "load_data", lambda *a, **k: pytest.fail("full tree loaded"))
+
+    routes.recalculate_handicaps()
+
+    assert applied == [(expected_rows, expected_fleet)]
+    assert ("R2", 1, 250) in expected_rows
+
+
+@pytest.mark.usefixtures("patch_datastore")
+def test_forward_recalc_drops_cached_readonly_tree(memory_store, monkeypatch):
+    from app import datastore as ds
+
+    memory_store["fleet"] = {"competitors": [
+        {"competitor_id": i, "sail_no": str(i), "sailor_name": f"S{i}", "boat_name": "", "starting_handicap_s_per_hr": 100, "current_handicap_s_per_hr": 100}
+        for i in range(1, 5)
+    ]}
+    memory_store["seasons"] = [{"year": 2025, "series": [
+        {"series_id": "S", "name": "S", "season": 2025, "races": [
+            {"race_id": rid, "date": date, "start_time": "00:00:00", "competitors": [
+                {"competitor_id": i, "finish_time": f"00:3{i}:00", "initial_handicap": 100}
+                for i in range(1, 5)
+            ]}
+            for rid, date in (("R1", "2025-01-01"), ("R2", "2025-01-08"))
+        ]}
+    ]}]
+
+    def apply_in_memory(seed_rows, fleet_current):
+        # Stand-in for the PostgreSQL batch: writes straight to the store
+        races = {r["race_id"]: r for r in memory_store["seasons"][0]["series"][0]["races"]}
+        for rid, cid, seed in seed_rows:
+            for ent in races[rid]["competitors"]:
+                if ent["competitor_id"] == cid:
+                    ent["initial_handicap"] = seed
+        return {"race_rows_updated": len(seed_rows), "competitors_updated": 0}
+
+    monkeypatch.setattr(routes._pg, "apply_recalculated_handicaps", apply_in_memory)
+    ds.invalidate()
+    stale = ds.load_data(readonly=True)
+
+    routes.recalculate_handicaps_from("R1", 2025)
+
+    r2 = memory_store["seasons"][0]["series"][0]["races"][1]
+    new_seed = {e["competitor_id"]: e["initial_handicap"] for e in r2["competitors"]}[1]
+    assert new_seed != 100
+    tree = ds.load_data(readonly=True)
+    assert tree is not stale
+    seeds = {e["competitor_id"]: e["initial_handicap"] for e in tree["seasons"][0]["series"][0]["races"][1]["competitors"]}
+    assert seeds[1] == new_seed
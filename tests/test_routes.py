@@ -91,6 +91,11 @@ def test_race_page_and_redirect(client):
     assert res.status_code == 302
     assert f"/series/SER_2025_Test?race_id={rid}" in res.headers["Location"]
 
+    # An unknown race id renders the series without a selected race
+    res = client.get("/series/SER_2025_Test?race_id=RACE_missing")
+    assert res.status_code == 200
+    assert "Number of Finishers" not in res.get_data(as_text=True)
+
 
 def test_races_page_lists_and_filters(client):
     res = client.get("/races")
@@ -127,6 +132,54 @@ def test_create_edit_delete_race(client):
     assert res3.status_code == 200
 
 
+def test_update_race_rejects_malformed_json(client):
+    res = client.post(
+        "/api/races/RACE_2025-01-01_Test_1",
+        data=b"{not json",
+        content_type="application/json",
+    )
+    assert res.status_code == 400
+
+
+def test_update_race_rejects_malformed_entries_before_loading(client, monkeypatch):
+    from app import routes
+
+    def fail_load(*a, **k):
+        raise AssertionError("data tree loaded for a bad payload")
+
+    monkeypatch.setattr(routes, "load_data", fail_load)
+    for payload in (
+        {"finish_times": ["00:30:00"]},
+        {"finish_times": [{"competitor_id": 1, "finish_time": "soon"}]},
+        {"handicap_overrides": [{"competitor_id": 99, "handicap": 10}]},
+    ):
+        res = client.post("/api/races/RACE_2025-01-01_Test_1", json=payload)
+        assert res.status_code == 400
+
+
+def test_health_handicaps_reports_seed_mismatches(client, memory_store):
+    from app import datastore as ds
+
+    assert client.get("/health/handicaps").get_json()["status"] == "ok"
+
+    race2 = memory_store["seasons"][0]["series"][0]["races"][1]
+    expected = race2["competitors"][1]["initial_handicap"]
+    race2["competitors"][1]["initial_handicap"] = expected + 7
+    ds.invalidate()
+
+    body = client.get("/health/handicaps").get_json()
+    assert body["status"] == "mismatch" and body["mismatch_count"] == 1
+    assert body["examples"] == [
+        {
+            "race_id": "RACE_2025-01-08_Test_2",
+            "competitor_id": 2,
+            "stored_initial": expected + 7,
+            "expected_initial": expected,
+            "override": None,
+        }
+    ]
+
+
 def test_fleet_update_and_duplicates(client):
     # Duplicate sail number
     payload = {
@@ -206,6 +259,36 @@ def test_update_fleet_add_edit_delete(client, memory_store):
     assert memory_store["fleet"]["competitors"][0]["competitor_id"] == 2
 
 
+def test_update_fleet_recalculates_only_for_handicap_changes(client, monkeypatch):
+    from app import routes
+
+    calls = []
+    monkeypatch.setattr(routes, "_schedule_full_recalc", lambda: calls.append(1))
+
+    def fleet(alice_name, alice_start):
+        return {
+            "competitors": [
+                {"competitor_id": 1, "sailor_name": alice_name, "boat_name": "Boaty", "sail_no": "1", "starting_handicap_s_per_hr": alice_start},
+                {"competitor_id": 2, "sailor_name": "Bob", "boat_name": "Crafty", "sail_no": "2", "starting_handicap_s_per_hr": 100},
+            ]
+        }
+
+    # Renaming a sailor leaves every handicap as it was
+    assert client.post("/api/fleet", json=fleet("Alicia", 100)).status_code == 200
+    assert calls == []
+
+    assert client.post("/api/fleet", json=fleet("Alicia", 120)).status_code == 200
+    assert calls == [1]
+
+    # Adding a boat with a starting handicap seeds it in any race listing it
+    added = fleet("Alicia", 120)
+    added["competitors"].append(
+        {"competitor_id": None, "sailor_name": "Cara", "boat_name": "Clipper", "sail_no": "3", "starting_handicap_s_per_hr": 95}
+    )
+    assert client.post("/api/fleet", json=added).status_code == 200
+    assert calls == [1, 1]
+
+
 def test_update_fleet_rejects_invalid_handicap(client):
     payload = {
         "competitors": [
@@ -367,3 +450,14 @@ def test_settings_page_and_save(client):
         },
     )
     assert res2.status_code == 200
+
+
+def test_json_endpoints_share_body_errors(client):
+    for url in ("/api/fleet", "/api/settings"):
+        res = client.post(url, data="{}", content_type="text/plain")
+        assert res.status_code == 415
+        assert "error" in res.get_json()
+
+        res = client.post(url, data="{not json", content_type="application/json")
+        assert res.status_code == 400
+        assert res.get_json()["error"] == "Request body must be valid JSON."
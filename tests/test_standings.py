@@ -1,5 +1,6 @@
 import pytest
 from app import routes, create_app
+from app import datastore as ds
 
 
 def test_traditional_standings_include_non_finishers(memory_store):
@@ -203,3 +204,49 @@ def test_standings_cells_link_to_race(memory_store):
     resp = client.get("/standings?season=2025&format=league")
     assert resp.status_code == 200
     assert f'href="/series/SER_2025_TEST?race_id={race_id}"' in resp.get_data(as_text=True)
+
+
+def test_standings_page_served_from_cache_until_write(memory_store, monkeypatch):
+    memory_store["fleet"] = {"competitors": [{"competitor_id": 1, "sailor_name": "Solo", "boat_name": "Boat", "sail_no": "1", "starting_handicap_s_per_hr": 0}]}
+    memory_store["seasons"] = [{"year": 2025, "series": [{"series_id": "SER_2025_TEST", "name": "Test", "season": 2025, "races": [{"race_id": "R1", "series_id": "SER_2025_TEST", "date": "2025-01-01", "start_time": "10:00:00", "competitors": [{"competitor_id": 1, "initial_handicap": 0, "finish_time": "10:30:00"}], "race_no": 1}]}]}]
+    app = create_app()
+    client = app.test_client()
+
+    calls = []
+    real = routes._season_standings
+    monkeypatch.setattr(routes, "_season_standings", lambda *a: calls.append(a) or real(*a))
+    routes._cache_clear_all()
+
+    first = client.get("/standings?season=2025").get_data(as_text=True)
+    assert client.get("/standings?season=2025").get_data(as_text=True) == first
+    assert len(calls) == 1
+
+    from app import datastore
+    datastore.save_data(datastore.load_data())
+    client.get("/standings?season=2025")
+    assert len(calls) == 2
+
+
+def test_standings_rescore_only_changed_races(memory_store, monkeypatch):
+    memory_store["fleet"] = {"competitors": [{"competitor_id": 1, "sailor_name": "Solo", "boat_name": "Boat", "sail_no": "1", "starting_handicap_s_per_hr": 0}]}
+    races = [
+        {"race_id": rid, "series_id": "SER_2025_TEST", "date": date, "start_time": "10:00:00",
+         "competitors": [{"competitor_id": 1, "initial_handicap": 0, "finish_time": "10:30:00"}], "race_no": n}
+        for n, (rid, date) in enumerate([("R1", "2025-01-01"), ("R2", "2025-01-08")], start=1)
+    ]
+    memory_store["seasons"] = [{"year": 2025, "series": [{"series_id": "SER_2025_TEST", "name": "Test", "season": 2025, "races": races}]}]
+    create_app()
+    routes._cache_clear_all()
+
+    calls = []
+    real = routes.calculate_race_results
+    monkeypatch.setattr(routes, "calculate_race_results", lambda entries: calls.append(1) or real(entries))
+
+    routes._season_standings(2025, "league")
+    assert len(calls) == 2
+
+    memory_store["seasons"][0]["series"][0]["races"][1]["competitors"][0]["finish_time"] = "10:40:00"
+    # The store was edited behind the datastore; drop every cached read
+    ds.invalidate()
+    routes._season_standings(2025, "league")
+    assert len(calls) == 3
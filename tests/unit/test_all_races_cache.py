@@ -0,0 +1,32 @@
+from app import create_app
+
+
+def test_sorted_race_list_is_shared_until_a_write(memory_store):
+    memory_store["seasons"] = [
+        {
+            "year": 2025,
+            "series": [
+                {
+                    "series_id": "SER_2025_Test",
+                    "name": "Test",
+                    "season": 2025,
+                    "races": [
+                        {"race_id": "R2", "series_id": "SER_2025_Test", "date": "2025-01-08", "competitors": []},
+                        {"race_id": "R1", "series_id": "SER_2025_Test", "date": "2025-01-01", "competitors": []},
+                    ],
+                }
+            ],
+        }
+    ]
+
+    app = create_app()
+    from app import routes
+    from app import datastore as ds
+
+    with app.test_request_context():
+        first = routes._sorted_all_races()
+        assert [r["race_id"] for r in first] == ["R1", "R2"]
+        assert routes._sorted_all_races() is first
+
+        ds.save_data(ds.load_data())
+        assert routes._sorted_all_races() is not first
@@ -0,0 +1,59 @@
+import pytest
+
+
+@pytest.fixture()
+def recorded(monkeypatch):
+    import app.datastore_pg as pg
+
+    statements = []
+
+    class FakeCursor:
+        rowcount = 1
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    class FakeConn:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def cursor(self, cursor_factory=None):
+            return FakeCursor()
+
+        def commit(self):
+            pass
+
+    monkeypatch.setattr(pg, "_get_conn", lambda: FakeConn())
+    monkeypatch.setattr(
+        pg, "execute_values", lambda cur, sql, rows, page_size=100: statements.append((sql, list(rows)))
+    )
+    return statements
+
+
+def test_override_rows_are_seeded_with_the_override(recorded):
+    import app.datastore_pg as pg
+
+    # The caller's seed for an overridden entrant is the override itself
+    pg.apply_recalculated_handicaps([("R2", 1, 250), ("R2", 2, 95)], {})
+
+    (sql, rows), = recorded
+    assert "UPDATE race_results" in sql
+    assert "handicap_override" not in sql
+    assert rows == [("R2", 1, 250), ("R2", 2, 95)]
+
+
+def test_fleet_currents_are_written_without_seed_rows(recorded):
+    import app.datastore_pg as pg
+
+    stats = pg.apply_recalculated_handicaps([], {1: 110, "2": 90})
+
+    (sql, rows), = recorded
+    assert "UPDATE competitors" in sql
+    assert rows == [(1, 110), (2, 90)]
+    assert stats == {"race_rows_updated": 0, "competitors_updated": 1}
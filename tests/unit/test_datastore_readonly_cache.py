@@ -0,0 +1,162 @@
+from flask import Flask
+
+
+def test_readonly_load_is_shared_within_request_and_dropped_on_write(monkeypatch, memory_store):
+    import app.datastore as ds
+    import app.datastore_pg as pg
+
+    calls = []
+    real_load = pg.load_data
+
+    def counting_load():
+        calls.append(1)
+        return real_load()
+
+    monkeypatch.setattr(pg, "load_data", counting_load)
+    ds.invalidate()
+
+    app = Flask(__name__)
+    with app.test_request_context():
+        first = ds.load_data(readonly=True)
+        assert ds.load_data(readonly=True) is first
+        assert len(calls) == 1
+
+        # Mutating loads are always fresh
+        assert ds.load_data() is not first
+        assert len(calls) == 2
+
+        ds.save_data({"seasons": []})
+        assert ds.load_data(readonly=True) is not first
+        assert len(calls) == 3
+
+    # Later requests reuse the tree until the next write
+    with app.test_request_context():
+        shared = ds.load_data(readonly=True)
+    with app.test_request_context():
+        assert ds.load_data(readonly=True) is shared
+    assert len(calls) == 3
+
+    ds.invalidate()
+    assert ds.load_data(readonly=True) is not shared
+    assert len(calls) == 4
+
+
+def test_shared_tree_expires_after_ttl(monkeypatch, memory_store):
+    import app.datastore as ds
+
+    monkeypatch.setattr(ds, "_DATA_TTL", 0)
+    ds.invalidate()
+    assert ds.load_data(readonly=True) is not ds.load_data(readonly=True)
+
+
+def test_find_race_indexed_uses_shared_tree(memory_store):
+    import app.datastore as ds
+
+    race = {"race_id": "R1", "date": "2025-01-01", "competitors": []}
+    memory_store["seasons"] = [
+        {"year": 2025, "series": [{"series_id": "S1", "name": "S", "season": 2025, "races": [race]}]}
+    ]
+    ds.invalidate()
+
+    season, series, found = ds.find_race_indexed("R1")
+    assert season["year"] == 2025 and series["series_id"] == "S1" and found["race_id"] == "R1"
+    assert found is ds.load_data(readonly=True)["seasons"][0]["series"][0]["races"][0]
+    assert ds.find_race_indexed("missing") == (None, None, None)
+
+
+def test_find_races_falls_back_to_one_tree_scan(monkeypatch, memory_store):
+    import app.datastore as ds
+    import app.datastore_pg as pg
+
+    def unavailable(ids):
+        raise pg.BackendUnavailable("no database")
+
+    monkeypatch.setattr(pg, "get_races_with_entries", unavailable)
+    memory_store["seasons"] = [
+        {
+            "year": 2025,
+            "series": [
+                {
+                    "series_id": "S1",
+                    "name": "S",
+                    "season": 2025,
+                    "races": [
+                        {"race_id": "R1", "date": "2025-01-01", "competitors": []},
+                        {"race_id": "R2", "date": "2025-01-08", "competitors": []},
+                    ],
+                }
+            ],
+        }
+    ]
+
+    found = ds.find_races(["R2", "missing"])
+    assert list(found) == ["R2"] and found["R2"]["date"] == "2025-01-08"
+    assert ds.find_races([]) == {}
+
+
+def test_find_races_surfaces_real_database_errors(monkeypatch, memory_store):
+    import pytest
+    import psycopg2
+    import app.datastore as ds
+    import app.datastore_pg as pg
+
+    def dropped(ids):
+        raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+    monkeypatch.setattr(pg, "get_races_with_entries", dropped)
+    monkeypatch.setattr(pg, "load_data", lambda: pytest.fail("fell back to a full tree load"))
+    with pytest.raises(psycopg2.OperationalError):
+        ds.find_races(["R1"])
+
+    def broken_stream():
+        raise psycopg2.ProgrammingError("column does not exist")
+        yield  # pragma: no cover
+
+    monkeypatch.setattr(pg, "iter_races_chronological", broken_stream)
+    with pytest.raises(psycopg2.ProgrammingError):
+        list(ds.iter_races_chronological())
+
+
+def test_direct_recalc_write_bumps_generation(monkeypatch, memory_store):
+    import pytest
+    import app.datastore as ds
+    import app.datastore_pg as pg
+
+    monkeypatch.setattr(pg, "apply_recalculated_handicaps", lambda rows, fleet: {"race_rows_updated": len(rows)})
+    before = ds.generation()
+    shared = ds.load_data(readonly=True)
+    ds.apply_recalculated_handicaps([("R1", 1, 100)], {})
+    assert ds.generation() > before
+    assert ds.load_data(readonly=True) is not shared
+
+    def broken(rows, fleet):
+        raise RuntimeError("connection lost mid-batch")
+
+    monkeypatch.setattr(pg, "apply_recalculated_handicaps", broken)
+    before = ds.generation()
+    with pytest.raises(RuntimeError):
+        ds.apply_recalculated_handicaps([("R1", 1, 100)], {})
+    assert ds.generation() > before
+
+
+def test_read_racing_a_write_is_not_cached_as_current(monkeypatch, memory_store):
+    import app.datastore as ds
+    import app.datastore_pg as pg
+
+    real_save = pg.save_data
+    during = []
+
+    def save_with_concurrent_read(data):
+        # Another request reads while the write is still in flight
+        during.append(ds.load_data(readonly=True))
+        real_save(data)
+
+    monkeypatch.setattr(pg, "save_data", save_with_concurrent_read)
+    ds.invalidate()
+
+    ds.save_data({"seasons": [{"year": 2030, "series": []}]})
+
+    assert during[0]["seasons"] == []
+    after = ds.load_data(readonly=True)
+    assert after is not during[0]
+    assert after["seasons"][0]["year"] == 2030
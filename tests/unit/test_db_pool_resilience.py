@@ -87,3 +87,73 @@ def test_pool_checkout_retries_on_stale_connection(monkeypatch):
     # Expect the bad connection to be returned with close=True at least once
     assert any(close for (_c, close) in pool.calls_put)
 
+
+
+def test_ping_is_skipped_within_interval_and_repeated_after(monkeypatch):
+    import app.datastore_pg as pg
+    pg = importlib.reload(pg)
+
+    pings = []
+
+    class Cursor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def execute(self, sql, params=None):
+            pings.append(sql)
+
+    class Conn:
+        autocommit = False
+        closed = 0
+        status = 0
+
+        def cursor(self, cursor_factory=None):
+            return Cursor()
+
+        def rollback(self):
+            pass
+
+    conn = Conn()
+
+    class Pool:
+        def getconn(self):
+            return conn
+
+        def putconn(self, c, close=False):
+            pass
+
+    now = [1000.0]
+    monkeypatch.setattr(pg, "_POOL", Pool())
+    monkeypatch.setattr(pg.time, "monotonic", lambda: now[0])
+    monkeypatch.setenv("DB_PING_INTERVAL", "5")
+
+    def checkout():
+        with pg._get_conn():
+            pass
+
+    checkout()
+    assert len(pings) == 1
+
+    # Within the interval the verified connection is trusted
+    now[0] += 4
+    checkout()
+    assert len(pings) == 1
+
+    # Past it, the connection is pinged again
+    now[0] += 2
+    checkout()
+    assert len(pings) == 2
+
+    # A closed connection is never trusted, whatever its timestamp
+    conn.closed = 1
+    discarded = []
+    monkeypatch.setattr(Pool, "putconn", lambda self, c, close=False: discarded.append(close))
+    try:
+        checkout()
+    except Exception:
+        pass
+    assert len(pings) == 2 and discarded and all(discarded)
+    assert conn not in pg._CONN_VERIFIED_AT
@@ -0,0 +1,32 @@
+import threading
+
+from app import create_app
+
+
+def test_debounced_recalc_reports_in_progress_until_it_finishes(monkeypatch, memory_store):
+    app = create_app()
+    from app import routes
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_recalc():
+        started.set()
+        release.wait(5)
+
+    monkeypatch.setattr(routes, "_RECALC_DEBOUNCE_S", 0.05)
+    monkeypatch.setattr(routes, "recalculate_handicaps", slow_recalc)
+
+    with app.test_client() as client:
+        with app.app_context():
+            routes._schedule_full_recalc()
+        # Queued behind the debounce timer, not yet running
+        assert not started.is_set()
+        assert client.get("/api/recalc/status").get_json()["in_progress"] is True
+
+        assert started.wait(5)
+        assert client.get("/api/recalc/status").get_json()["in_progress"] is True
+
+        release.set()
+        routes._EXECUTOR.submit(lambda: None).result(5)
+        assert client.get("/api/recalc/status").get_json()["in_progress"] is False
@@ -53,6 +53,10 @@ def test_save_data_rewrites_only_when_competitors_present(monkeypatch):
         return _Ctx(FakeConn(recorded))
 
     monkeypatch.setattr(pg, "_get_conn", fake_get_conn)
+    # Batched writes: record each execute_values page as one statement
+    monkeypatch.setattr(
+        pg, "execute_values", lambda cur, sql, rows, page_size=100: cur.execute(sql, rows[0])
+    )
 
     # Build payload with two races in one series: only one provides 'competitors'
     race_a = {
@@ -121,3 +125,46 @@ def test_save_data_rewrites_only_when_competitors_present(monkeypatch):
     assert "RACE_B" not in deletes, "Did not expect entrants delete for RACE_B"
     assert "RACE_B" not in inserts, "Did not expect entrants insert for RACE_B"
 
+
+
+def test_replace_race_results_overwrites_missing_seed(monkeypatch):
+    import app.datastore_pg as pg
+    pg = importlib.reload(pg)
+
+    batches = []
+
+    class FakeCursor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def execute(self, sql, params=None):
+            pass
+
+    class FakeConn:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def cursor(self, cursor_factory=None):
+            return FakeCursor()
+
+        def commit(self):
+            pass
+
+    monkeypatch.setattr(pg, "_get_conn", lambda: FakeConn())
+    monkeypatch.setattr(
+        pg, "execute_values", lambda cur, sql, rows, page_size=100: batches.append((sql, list(rows)))
+    )
+
+    pg.replace_race_results("R2", [{"competitor_id": 1, "finish_time": "00:30:00"}])
+
+    (sql, rows), = batches
+    assert rows == [("R2", 1, None, "00:30:00", None)]
+    # A stale seed (e.g. from a race deleted before renumbering) is not kept
+    assert "initial_handicap = EXCLUDED.initial_handicap" in sql
+    assert "COALESCE" not in sql
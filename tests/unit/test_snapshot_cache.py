@@ -0,0 +1,66 @@
+from app import create_app
+
+
+def _race(rid, date, finishes):
+    return {
+        "race_id": rid,
+        "series_id": "SER_2025_Test",
+        "name": rid,
+        "date": date,
+        "start_time": "00:00:00",
+        "competitors": [
+            {"competitor_id": cid, "finish_time": ft} for cid, ft in finishes
+        ],
+    }
+
+
+def test_pre_race_snapshot_resumes_from_cached_prior_race(monkeypatch, memory_store):
+    memory_store["fleet"] = {
+        "competitors": [
+            {"competitor_id": 1, "sailor_name": "A", "boat_name": "A", "sail_no": "1", "starting_handicap_s_per_hr": 100},
+            {"competitor_id": 2, "sailor_name": "B", "boat_name": "B", "sail_no": "2", "starting_handicap_s_per_hr": 100},
+        ]
+    }
+    memory_store["seasons"] = [
+        {
+            "year": 2025,
+            "series": [
+                {
+                    "series_id": "SER_2025_Test",
+                    "name": "Test",
+                    "season": 2025,
+                    "races": [
+                        _race("R1", "2025-01-01", [(1, "00:30:00"), (2, "00:40:00")]),
+                        _race("R2", "2025-01-08", [(1, "00:35:00"), (2, "00:31:00")]),
+                        _race("R3", "2025-01-15", [(1, "00:33:00"), (2, "00:34:00")]),
+                    ],
+                }
+            ],
+        }
+    ]
+
+    app = create_app()
+    from app import routes
+    from app import datastore as ds
+
+    real_calc = routes.calculate_race_results
+    calls = []
+
+    def counting_calc(entries):
+        calls.append(1)
+        return real_calc(entries)
+
+    monkeypatch.setattr(routes, "calculate_race_results", counting_calc)
+
+    with app.test_request_context():
+        first = routes.build_pre_race_snapshot("R3")
+        assert len(calls) == 2
+
+        # Both prior races are cached; nothing is replayed
+        assert routes.build_pre_race_snapshot("R3") == first
+        assert len(calls) == 2
+
+        # A write invalidates the cached maps
+        ds.save_data(ds.load_data())
+        assert routes.build_pre_race_snapshot("R3") == first
+        assert len(calls) == 4
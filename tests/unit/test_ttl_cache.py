@@ -0,0 +1,25 @@
+from app.routes import _TTLCache
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = _TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the oldest
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+def test_ttl_cache_expires_on_monotonic_clock(monkeypatch):
+    import app.routes as routes
+
+    now = [100.0]
+    monkeypatch.setattr(routes.time, "monotonic", lambda: now[0])
+    cache = _TTLCache(ttl=10, maxsize=4)
+    cache.set("a", 1)
+    now[0] = 109.0
+    assert cache.get("a") == 1
+    now[0] = 111.0
+    assert cache.get("a") is None
+    assert cache.keys() == []